@@ -22,7 +22,12 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from ac_conference_helper.core.models import Submission
-from ac_conference_helper.core.display import display_results
+from ac_conference_helper.core.display import (
+    PYARROW_AVAILABLE,
+    display_results,
+    load_submissions_arrow,
+    save_submissions_arrow,
+)
 from ac_conference_helper.core.submission_analyzer import SubmissionAnalyzer
 from ac_conference_helper.config.constants import AVAILABLE_ANALYSES
 from ac_conference_helper.config.conference_config import (
@@ -41,21 +46,26 @@ CACHE_FILE_PREFIX = os.getenv("CACHE_FILE_PREFIX", "submissions_")
 os.makedirs(CACHE_DIR, exist_ok=True)
 
 
-def get_cache_filename(conf: str, skip_reviews: bool) -> str:
+def get_cache_filename(conf: str, skip_reviews: bool, ext: str = "pkl") -> str:
     """Generate cache filename based on conference and settings."""
     reviews_suffix = "_no_reviews" if skip_reviews else ""
-    return f"{CACHE_FILE_PREFIX}{conf}{reviews_suffix}.pkl"
+    return f"{CACHE_FILE_PREFIX}{conf}{reviews_suffix}.{ext}"
 
 
 def save_submissions_to_cache(
     subs: list[Submission], conf: str, skip_reviews: bool
 ) -> None:
-    """Save submissions to cache file."""
+    """Save submissions to cache file (Arrow IPC if pyarrow is available)."""
     os.makedirs(CACHE_DIR, exist_ok=True)
-    cache_file = os.path.join(CACHE_DIR, get_cache_filename(conf, skip_reviews))
 
-    with open(cache_file, "wb") as f:
-        pickle.dump(subs, f)
+    if PYARROW_AVAILABLE:
+        cache_file = os.path.join(CACHE_DIR, get_cache_filename(conf, skip_reviews, "arrow"))
+        save_submissions_arrow(subs, cache_file)
+    else:
+        cache_file = os.path.join(CACHE_DIR, get_cache_filename(conf, skip_reviews))
+        with open(cache_file, "wb") as f:
+            # Newest protocol gives the most compact, fastest-loading encoding
+            pickle.dump(subs, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     print(f"Cached {len(subs)} submissions to {cache_file}")
 
@@ -63,15 +73,23 @@ def save_submissions_to_cache(
 def load_submissions_from_cache(
     conf: str, skip_reviews: bool
 ) -> Optional[list[Submission]]:
-    """Load submissions from cache file if exists."""
-    cache_file = os.path.join(CACHE_DIR, get_cache_filename(conf, skip_reviews))
-
-    if not os.path.exists(cache_file):
+    """Load submissions from cache file if exists, preferring the Arrow cache."""
+    arrow_file = os.path.join(CACHE_DIR, get_cache_filename(conf, skip_reviews, "arrow"))
+    pickle_file = os.path.join(CACHE_DIR, get_cache_filename(conf, skip_reviews))
+
+    if PYARROW_AVAILABLE and os.path.exists(arrow_file):
+        cache_file = arrow_file
+    elif os.path.exists(pickle_file):
+        cache_file = pickle_file
+    else:
         return None
 
     try:
-        with open(cache_file, "rb") as f:
-            subs = pickle.load(f)
+        if cache_file == arrow_file:
+            subs = load_submissions_arrow(cache_file)
+        else:
+            with open(cache_file, "rb") as f:
+                subs = pickle.load(f)
         print(f"Loaded {len(subs)} submissions from cache {cache_file}")
         return subs
     except Exception as e:
@@ -97,7 +115,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--simulate", action="store_true", help="Simulate the process with dummy data"
     )
-    parser.add_argument("--output", type=str, help="Save results to CSV file")
+    parser.add_argument(
+        "--output", type=str, help="Save results to CSV file (or Feather for .feather)"
+    )
     parser.add_argument(
         "--format",
         choices=["grid", "pipe", "simple", "github"],
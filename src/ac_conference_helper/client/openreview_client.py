@@ -25,6 +25,105 @@ load_dotenv()
 from ac_conference_helper.core.models import Submission, Review, MetaReview, SubmissionStatus
 from ac_conference_helper.config.conference_config import get_conference_config, ConferenceConfig
 
+# Review section headers, keyed by the Review field they populate
+_REVIEW_FIELD_LABELS = {
+    "paper_summary": "Paper Summary:",
+    "preliminary_recommendation": "Preliminary Recommendation:",
+    # Header continues up to the first colon ("... And Suggestions For Rebuttal:")
+    "justification_for_recommendation": "Justification For Recommendation",
+    "confidence_level": "Confidence Level:",
+    "paper_strengths": "Paper Strengths:",
+    "major_weaknesses": "Major Weaknesses:",
+    "minor_weaknesses": "Minor Weaknesses:",
+    "final_recommendation": "Final Recommendation:",
+    "final_justification": "Final Justification:",
+}
+
+_DATE_PATTERN = r"\d{1,2}\s+\w+\s+\d{4},\s+\d{1,2}:\d{2}"
+_REVIEWER_SIGNATURE_RE = re.compile(r"\s+(.+?\))")
+_MODIFIED_DATE_RE = re.compile(r"\s*(" + _DATE_PATTERN + ")")
+
+
+def _marker(kind: str):
+    return lambda scanner, token: (kind, scanner.match.end())
+
+
+# Single-pass lexers: header/marker tokens are emitted with their end offset,
+# a newline followed by an uppercase letter terminates open review fields and
+# plain text is skipped in runs.
+_REVIEW_SCANNER = re.Scanner(
+    [(re.escape(label), _marker(name)) for name, label in _REVIEW_FIELD_LABELS.items()]
+    + [
+        (r"\n(?=[A-Z])", lambda scanner, token: (None, scanner.match.start())),
+        (r"[^\nPJCMF]+", None),
+        (r"[\s\S]", None),
+    ]
+)
+
+_SUBHEADING_SCANNER = re.Scanner(
+    [
+        (r"by Reviewer", _marker("reviewer_id")),
+        (r"modified:", _marker("modified_date")),
+        (_DATE_PATTERN, lambda scanner, token: ("submission_date", token)),
+        (r"[^\dbm]+", None),
+        (r"[\s\S]", None),
+    ]
+)
+
+
+def _skip_whitespace(text: str, position: int) -> int:
+    while position < len(text) and text[position].isspace():
+        position += 1
+    return position
+
+
+def _scan_review_fields(content: str) -> dict[str, str]:
+    """Extract review fields from content in a single lexer pass.
+
+    Each field captures the text following its first header up to the next
+    line starting with an uppercase letter (or the end of the content).
+    """
+    tokens, _ = _REVIEW_SCANNER.scan(content)
+
+    fields = {}
+    open_fields = {}
+    for field_name, position in tokens:
+        if field_name is None:
+            for name, start in list(open_fields.items()):
+                if position >= start:
+                    fields[name] = content[start:position].strip()
+                    del open_fields[name]
+        elif field_name not in fields and field_name not in open_fields:
+            if field_name == "justification_for_recommendation":
+                position = content.find(":", position) + 1
+                if not position:
+                    continue
+            open_fields[field_name] = _skip_whitespace(content, position)
+
+    for name, start in open_fields.items():
+        fields[name] = content[start:].strip()
+
+    return {name: text for name, text in fields.items() if text}
+
+
+def _scan_subheading(subheading_text: str) -> dict[str, str]:
+    """Extract reviewer ID, submission date and modified date from a subheading."""
+    tokens, _ = _SUBHEADING_SCANNER.scan(subheading_text)
+
+    info = {}
+    for key, value in tokens:
+        if key in info:
+            continue
+        if key == "submission_date":
+            info[key] = value
+            continue
+
+        pattern = _REVIEWER_SIGNATURE_RE if key == "reviewer_id" else _MODIFIED_DATE_RE
+        match = pattern.match(subheading_text, value)
+        if match:
+            info[key] = match.group(1).strip()
+    return info
+
 
 class OpenReviewClient:
     """Client for interacting with OpenReview API."""
@@ -190,52 +289,34 @@ class OpenReviewClient:
                     content = review_content.text
 
                 if is_meta_review:
-                    meta_review = MetaReview(content=content, raw_content=content)
+                    raw_content = content
 
                     try:
                         if subheading and subheading.text:
-                            subheading_text = subheading.text
-
                             # Extract submission date (first date)
-                            date_match = re.search(
-                                r"(\d{1,2}\s+\w+\s+\d{4},\s+\d{1,2}:\d{2})", subheading_text
+                            submission_date = _scan_subheading(subheading.text).get(
+                                "submission_date"
                             )
-                            if date_match:
-                                meta_review.raw_content = f"Date: {date_match.group(1)}\n\n{content}"
+                            if submission_date:
+                                raw_content = f"Date: {submission_date}\n\n{content}"
                     except Exception as e:
                         logger.error(
                             "Error parsing meta-review info from subheading", error=str(e)
                         )
+
+                    meta_review = MetaReview(content=content, raw_content=raw_content)
                 else:
-                    # Create regular Review object
-                    review = Review(raw_content=content)
+                    # Collect fields first; Review is immutable once created
+                    review_fields = {"raw_content": content}
 
                     # Parse reviewer ID and dates from subheading if available
                     try:
                         if subheading:
-                            subheading_text = subheading.text
-
-                            # Extract reviewer ID using regex
-                            reviewer_match = re.search(
-                                r"by Reviewer\s+(.+?\))", subheading_text
-                            )
-                            if reviewer_match:
-                                review.reviewer_id = reviewer_match.group(1).strip()
-
-                            # Extract submission date (first date)
-                            date_match = re.search(
-                                r"(\d{1,2}\s+\w+\s+\d{4},\s+\d{1,2}:\d{2})", subheading_text
-                            )
-                            if date_match:
-                                review.submission_date = date_match.group(1)
-
-                            # Extract modified date (after "modified:")
-                            modified_match = re.search(
-                                r"modified:\s*(\d{1,2}\s+\w+\s+\d{4},\s+\d{1,2}:\d{2})",
-                                subheading_text,
-                            )
-                            if modified_match:
-                                review.modified_date = modified_match.group(1)
+                            # Extract reviewer ID, submission date and modified date
+                            subheading_info = _scan_subheading(subheading.text)
+                            review_fields["reviewer_id"] = subheading_info.get("reviewer_id")
+                            review_fields["submission_date"] = subheading_info.get("submission_date")
+                            review_fields["modified_date"] = subheading_info.get("modified_date")
 
                     except Exception as e:
                         logger.error(
@@ -244,38 +325,20 @@ class OpenReviewClient:
                         pass
 
                     # Fallback to original signature extraction if subheading doesn't have reviewer info
-                    if not review.reviewer_id:
+                    if not review_fields.get("reviewer_id"):
                         try:
                             signature_element = element.find_element(
                                 By.CSS_SELECTOR, ".signatures"
                             )
                             if signature_element:
-                                review.reviewer_id = signature_element.text
+                                review_fields["reviewer_id"] = signature_element.text
                         except:
                             pass
 
-                    # Pattern to find field headers and content
-                    field_patterns = {
-                        "paper_summary": r"Paper Summary:\s*(.*?)(?=\n[A-Z]|$)",
-                        "preliminary_recommendation": r"Preliminary Recommendation:\s*(.*?)(?=\n[A-Z]|$)",
-                        "justification_for_recommendation": r"Justification For Recommendation.*?:\s*(.*?)(?=\n[A-Z]|$)",
-                        "confidence_level": r"Confidence Level:\s*(.*?)(?=\n[A-Z]|$)",
-                        "paper_strengths": r"Paper Strengths:\s*(.*?)(?=\n[A-Z]|$)",
-                        "major_weaknesses": r"Major Weaknesses:\s*(.*?)(?=\n[A-Z]|$)",
-                        "minor_weaknesses": r"Minor Weaknesses:\s*(.*?)(?=\n[A-Z]|$)",
-                        "final_recommendation": r"Final Recommendation:\s*(.*?)(?=\n[A-Z]|$)",
-                        "final_justification": r"Final Justification:\s*(.*?)(?=\n[A-Z]|$)",
-                    }
-
-                    # Extract fields using regex
-                    for field_name, pattern in field_patterns.items():
-                        match = re.search(pattern, content, re.DOTALL)
-                        if match:
-                            content_text = match.group(1).strip()
-                            if content_text:
-                                setattr(review, field_name, content_text)
-
-                    reviews.append(review)
+                    # Extract fields in a single pass over the content
+                    review_fields.update(_scan_review_fields(content))
+
+                    reviews.append(Review(**review_fields))
 
             except Exception as e:
                 logger.error("Error parsing review", error=str(e))
@@ -10,7 +10,7 @@ from tabulate import tabulate
 
 from ac_conference_helper.core.models import Submission
 from ac_conference_helper.core.submission_analyzer import EnhancedSubmission, SubmissionAnalyzer
-from ac_conference_helper.core.llm_integration import create_llm_client_from_env
+from ac_conference_helper.core.llm_integration import OllamaClient, create_llm_client_from_env
 
 # Import logging configuration
 from ac_conference_helper.utils.logging_config import get_logger
@@ -19,11 +19,11 @@ from ac_conference_helper.utils.logging_config import get_logger
 logger = get_logger(__name__)
 
 # Local functions for statistics
-mean_std = lambda values: (
-    f"{np.mean([v for v in values if v != -1]):.2f}±{np.std([v for v in values if v != -1]):.2f}"
-    if values and any(v != -1 for v in values)
-    else "-"
-)
+def mean_std(values: List[int]) -> str:
+    """Format mean±std of the values, ignoring missing (-1) entries."""
+    valid = np.asarray(values, dtype=np.float64)
+    valid = valid[valid != -1]
+    return f"{valid.mean():.2f}±{valid.std():.2f}" if valid.size else "-"
 
 
 @dataclass
@@ -44,11 +44,14 @@ class ChatSession:
 class SubmissionChatSystem:
     """Interactive chat system for analyzing submissions."""
 
-    def __init__(self, submissions: List[Submission] = None):
+    def __init__(
+        self,
+        submissions: List[Submission] = None,
+        llm_client: Optional[OllamaClient] = None,
+    ):
         """Initialize chat system."""
-        self.submissions = submissions or []
-        self.submissions_dict = {sub.sub_id: sub for sub in self.submissions}
-        self.llm_client = create_llm_client_from_env()
+        self.update_submissions(submissions)
+        self.llm_client = llm_client or create_llm_client_from_env()
         self.session = ChatSession()
 
         # Available commands
@@ -69,6 +72,11 @@ class SubmissionChatSystem:
             "stats": self.show_stats,
         }
 
+    def update_submissions(self, submissions: List[Submission] = None):
+        """Replace the submissions, keeping the LLM client and chat session."""
+        self.submissions = submissions or []
+        self.submissions_dict = {sub.sub_id: sub for sub in self.submissions}
+
     def start(self):
         """Start the interactive chat system."""
         print("=" * 60)
@@ -519,28 +527,23 @@ class SubmissionChatSystem:
             total_reviews = sum(len(sub.reviews) for sub in self.submissions)
             avg_reviews = total_reviews / len(self.submissions)
 
-            ratings = []
-            final_ratings = []
-            for sub in self.submissions:
-                if sub.ratings:
-                    ratings.extend(sub.ratings)
-                if sub.final_ratings:
-                    final_ratings.extend(sub.final_ratings)
+            ratings = np.concatenate([sub.rating_array for sub in self.submissions])
+            final_ratings = np.concatenate(
+                [sub.final_rating_array for sub in self.submissions]
+            )
 
             print(f"Total Reviews: {total_reviews}")
             print(f"Average Reviews per Submission: {avg_reviews:.2f}")
 
-            if ratings:
-                import statistics
-
-                print(f"Average Rating: {statistics.mean(ratings):.2f}")
-                print(f"Rating Std Dev: {statistics.stdev(ratings):.2f}")
-
-            if final_ratings:
-                import statistics
+            if ratings.size:
+                print(f"Average Rating: {ratings.mean():.2f}")
+                if ratings.size > 1:
+                    print(f"Rating Std Dev: {ratings.std(ddof=1):.2f}")
 
-                print(f"Average Final Rating: {statistics.mean(final_ratings):.2f}")
-                print(f"Final Rating Std Dev: {statistics.stdev(final_ratings):.2f}")
+            if final_ratings.size:
+                print(f"Average Final Rating: {final_ratings.mean():.2f}")
+                if final_ratings.size > 1:
+                    print(f"Final Rating Std Dev: {final_ratings.std(ddof=1):.2f}")
 
         print("-" * 40)
         print()
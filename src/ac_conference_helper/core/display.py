@@ -2,10 +2,18 @@
 
 import argparse
 import os
-from typing import Optional
+import sys
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Optional
 
-import pandas as pd
-from tabulate import tabulate
+import numpy as np
+from pydantic import BaseModel
+
+# pandas, tabulate and pyarrow are imported lazily by the functions that need them
+if TYPE_CHECKING:
+    import pandas as pd
+
+PYARROW_AVAILABLE = find_spec("pyarrow") is not None
 
 from ac_conference_helper.core.models import Submission, MetaReview, SubmissionStatus
 from ac_conference_helper.core.models import int_list_to_str
@@ -25,8 +33,36 @@ class Colors:
     END = "\033[0m"
 
 
+# Module-level aliases for the colors used in per-cell formatting loops
+_GREEN = Colors.GREEN
+_RED = Colors.RED
+_BLUE = Colors.BLUE
+_END = Colors.END
+
+# Row colors indexed by rating completeness (False -> red, True -> green)
+_ROW_COLORS = (_RED, _GREEN)
+
+
+def _format_floats(values: np.ndarray) -> list[str]:
+    """Format an array of floats with two decimals in one vectorized call."""
+    return np.char.mod("%.2f", values).tolist()
+
+
+# Colored decision labels keyed by raw decision; conferences use only a handful of labels
+_DECISION_COLOR_CACHE: dict[Optional[str], str] = {}
+
+
 def format_meta_review_decision(decision: Optional[str]) -> str:
     """Format meta-review decision with appropriate colors."""
+    try:
+        return _DECISION_COLOR_CACHE[decision]
+    except KeyError:
+        formatted = _DECISION_COLOR_CACHE[decision] = _color_decision(decision)
+        return formatted
+
+
+def _color_decision(decision: Optional[str]) -> str:
+    """Pick the decision color from accept/reject/discussion keywords."""
     if not decision:
         return f"{Colors.YELLOW}N/A{Colors.END}"
     
@@ -47,119 +83,175 @@ def format_meta_review_decision(decision: Optional[str]) -> str:
         return decision
 
 
-def submissions_to_dataframe(
+# Column holding the per-row ANSI color of plain submission DataFrames
+_ROW_COLOR_COLUMN = "_row_color"
+
+# Columns colored with the row color when rendering
+_ROW_COLORED_COLUMNS = [
+    "#", "ID", "Title", "Status", "reviews_status", "Ratings", "Avg_Rating",
+    "Std_Rating", "Confidences", "Final_Ratings", "Avg_Final", "Std_Final",
+]
+
+
+def _row_color(sub: Submission) -> str:
+    """Row color: green if both ratings and final ratings have >= 3 valid entries."""
+    return _ROW_COLORS[sub.num_valid_ratings >= 3 and sub.num_valid_final_ratings >= 3]
+
+
+def _submissions_to_plain_dataframe(
     subs: list[Submission], include_urls: bool = False
-) -> pd.DataFrame:
-    """Convert submissions list to pandas DataFrame with color coding."""
-    data = []
+) -> "pd.DataFrame":
+    """Convert submissions list to a DataFrame of raw fields plus a row color column."""
+    import pandas as pd
+
+    n = len(subs)
+    ids, titles, urls, statuses, reviews_statuses, row_colors = ([None] * n for _ in range(6))
+    meta_prelims, meta_finals = [""] * n, [""] * n
+    ratings, confidences, final_ratings = ([None] * n for _ in range(3))
+    avg_ratings, std_ratings, avg_finals, std_finals = (np.empty(n) for _ in range(4))
+
     for idx, sub in enumerate(subs):
         # Count valid ratings (excluding -1 values)
-        valid_prelim_ratings = [r for r in sub.ratings if r != -1]
-        valid_final_ratings = [r for r in sub.final_ratings if r != -1]
-        
-        # Determine color based on valid ratings - color is green if both have >= 3 valid ratings
-        line_color = Colors.GREEN if (len(valid_prelim_ratings) >= 3 and len(valid_final_ratings) >= 3) else Colors.RED
+        complete = sub.num_valid_ratings >= 3 and sub.num_valid_final_ratings >= 3
+        row_colors[idx] = _ROW_COLORS[complete]
 
-        # Create URL link if available
-        url_link = ""
-        if include_urls and hasattr(sub, "url"):
-            url_link = f"{Colors.BLUE}{sub.url}{Colors.END}"
+        # Keep URL only if requested
+        urls[idx] = sub.url if include_urls else ""
 
-        # Get meta-review decisions
-        meta_prelim_decision = ""
-        meta_final_decision = ""
-        if hasattr(sub, "meta_review") and sub.meta_review:
-            meta_prelim_decision = format_meta_review_decision(sub.meta_review.preliminary_decision)
-            meta_final_decision = format_meta_review_decision(sub.meta_review.final_decision)
+        # Get meta-review decisions (None marks a meta-review without decision)
+        if sub.meta_review:
+            meta_prelims[idx] = sub.meta_review.preliminary_decision
+            meta_finals[idx] = sub.meta_review.final_decision
 
         # Format withdrawal and desk rejection status
         if sub.status == SubmissionStatus.WITHDRAWN:
-            withdrawal_status = f"{line_color}🚫 WITHDRAWN{Colors.END}"
+            statuses[idx] = "🚫 WITHDRAWN"
         elif sub.status == SubmissionStatus.DESK_REJECTED:
-            withdrawal_status = f"{line_color}📋 DESK REJECTED{Colors.END}"
+            statuses[idx] = "📋 DESK REJECTED"
         else:
-            withdrawal_status = f"{line_color}✅ Active{Colors.END}"
-        
+            statuses[idx] = "✅ Active"
+
         # Determine reviews status based on valid ratings
-        reviews_status = f"{line_color}✅ Complete{Colors.END}" if (len(valid_prelim_ratings) >= 3 and len(valid_final_ratings) >= 3) else f"{line_color}⚠️ Incomplete{Colors.END}"
-
-        # Apply color to all text fields in the row
-        data.append(
-            {
-                "#": f"{line_color}{idx + 1}{Colors.END}",
-                "ID": f"{line_color}{sub.sub_id}{Colors.END}",
-                "Title": f"{line_color}{sub.title}{Colors.END}",
-                "URL": url_link if url_link else f"{line_color}{Colors.END}",
-                "Status": withdrawal_status,
-                "reviews_status": reviews_status,
-                "Meta_Prelim": meta_prelim_decision,
-                "Meta_Final": meta_final_decision,
-                "Ratings": f"{line_color}{int_list_to_str(sub.ratings)}{Colors.END}",
-                "Avg_Rating": f"{line_color}{sub.avg_rating:.2f}{Colors.END}",
-                "Std_Rating": f"{line_color}{sub.std_rating:.2f}{Colors.END}",
-                "Confidences": f"{line_color}{int_list_to_str(sub.confidences)}{Colors.END}",
-                "Final_Ratings": f"{line_color}{int_list_to_str(sub.final_ratings)}{Colors.END}",
-                "Avg_Final": f"{line_color}{sub.avg_final_rating:.2f}{Colors.END}",
-                "Std_Final": f"{line_color}{sub.std_final_rating:.2f}{Colors.END}",
-            }
-        )
-    return pd.DataFrame(data)
+        reviews_statuses[idx] = "✅ Complete" if complete else "⚠️ Incomplete"
+
+        ids[idx] = sub.sub_id
+        titles[idx] = sub.title
+        ratings[idx] = int_list_to_str(sub.ratings)
+        avg_ratings[idx] = sub.avg_rating
+        std_ratings[idx] = sub.std_rating
+        confidences[idx] = int_list_to_str(sub.confidences)
+        final_ratings[idx] = int_list_to_str(sub.final_ratings)
+        avg_finals[idx] = sub.avg_final_rating
+        std_finals[idx] = sub.std_final_rating
+
+    return pd.DataFrame(
+        {
+            "#": list(range(1, n + 1)),
+            "ID": ids,
+            "Title": titles,
+            "URL": urls,
+            "Status": statuses,
+            "reviews_status": reviews_statuses,
+            "Meta_Prelim": meta_prelims,
+            "Meta_Final": meta_finals,
+            "Ratings": ratings,
+            "Avg_Rating": _format_floats(avg_ratings),
+            "Std_Rating": _format_floats(std_ratings),
+            "Confidences": confidences,
+            "Final_Ratings": final_ratings,
+            "Avg_Final": _format_floats(avg_finals),
+            "Std_Final": _format_floats(std_finals),
+            _ROW_COLOR_COLUMN: row_colors,
+        }
+    )
+
+
+def _colorize_dataframe(df: "pd.DataFrame") -> "pd.DataFrame":
+    """Apply ANSI colors to a plain submissions DataFrame for terminal rendering."""
+    row_colors = df[_ROW_COLOR_COLUMN].tolist()
+    colored = df.drop(columns=_ROW_COLOR_COLUMN)
+
+    # One bound formatter per row, reused for every colored cell of that row
+    wraps = [(color + "{}" + _END).format for color in row_colors]
+    for column in _ROW_COLORED_COLUMNS:
+        colored[column] = [wrap(value) for wrap, value in zip(wraps, df[column].tolist())]
+    colored["URL"] = [
+        f"{_BLUE}{url}{_END}" if url else f"{color}{_END}"
+        for color, url in zip(row_colors, df["URL"].tolist())
+    ]
+    for column in ("Meta_Prelim", "Meta_Final"):
+        colored[column] = [
+            "" if decision == "" else format_meta_review_decision(decision)
+            for decision in df[column].tolist()
+        ]
+    return colored
+
+
+def submissions_to_dataframe(
+    subs: list[Submission], include_urls: bool = False
+) -> "pd.DataFrame":
+    """Convert submissions list to pandas DataFrame with color coding."""
+    return _colorize_dataframe(_submissions_to_plain_dataframe(subs, include_urls=include_urls))
 
 
 def submissions_to_dataframe_streamlit(
     subs: list[Submission], include_urls: bool = False
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """Convert submissions list to pandas DataFrame for Streamlit display without ANSI colors."""
-    data = []
-    for idx, sub in enumerate(subs):
-        # Count valid ratings (excluding -1 values)
-        valid_prelim_ratings = [r for r in sub.ratings if r != -1]
-        valid_final_ratings = [r for r in sub.final_ratings if r != -1]
-        
-        # Determine status based on valid ratings
-        reviews_status = "✅ Complete" if (len(valid_prelim_ratings) >= 3 and len(valid_final_ratings) >= 3) else "⚠️ Incomplete"
+    import pandas as pd
 
-        # Create URL link if available
-        url_link = ""
-        if include_urls and hasattr(sub, "url"):
-            url_link = sub.url
+    n = len(subs)
+    ids, titles, statuses, reviews_statuses = ([None] * n for _ in range(4))
+    meta_prelims, meta_finals = [""] * n, [""] * n
+    ratings, confidences, final_ratings = ([None] * n for _ in range(3))
+    avg_ratings, std_ratings, avg_finals, std_finals = (np.empty(n) for _ in range(4))
+
+    for idx, sub in enumerate(subs):
+        # Determine status based on valid ratings (excluding -1 values)
+        reviews_statuses[idx] = "✅ Complete" if (sub.num_valid_ratings >= 3 and sub.num_valid_final_ratings >= 3) else "⚠️ Incomplete"
 
         # Get meta-review decisions
-        meta_prelim_decision = ""
-        meta_final_decision = ""
-        if hasattr(sub, "meta_review") and sub.meta_review:
-            meta_prelim_decision = sub.meta_review.preliminary_decision or "N/A"
-            meta_final_decision = sub.meta_review.final_decision or "N/A"
+        if sub.meta_review:
+            meta_prelims[idx] = sub.meta_review.preliminary_decision or "N/A"
+            meta_finals[idx] = sub.meta_review.final_decision or "N/A"
 
         # Format withdrawal and desk rejection status
         if sub.status == SubmissionStatus.WITHDRAWN:
-            status = "🚫 WITHDRAWN"
+            statuses[idx] = "🚫 WITHDRAWN"
         elif sub.status == SubmissionStatus.DESK_REJECTED:
-            status = "📋 DESK REJECTED"
+            statuses[idx] = "📋 DESK REJECTED"
         else:
-            status = "✅ Active"
+            statuses[idx] = "✅ Active"
 
         # Add data without ANSI colors
-        data.append(
-            {
-                "#": idx + 1,
-                "ID": sub.sub_id,
-                "Title": sub.title,
-                # "URL": url_link if url_link else "",
-                "status": status,
-                "reviews_status": reviews_status,
-                "Meta_Prelim": meta_prelim_decision,
-                "Meta_Final": meta_final_decision,
-                "Ratings": int_list_to_str(sub.ratings),
-                "Avg_Rating": f"{sub.avg_rating:.2f}",
-                "Std_Rating": f"{sub.std_rating:.2f}",
-                "Confidences": int_list_to_str(sub.confidences),
-                "Final_Ratings": int_list_to_str(sub.final_ratings),
-                "Avg_Final": f"{sub.avg_final_rating:.2f}",
-                "Std_Final": f"{sub.std_final_rating:.2f}",
-            }
-        )
-    return pd.DataFrame(data)
+        ids[idx] = sub.sub_id
+        titles[idx] = sub.title
+        ratings[idx] = int_list_to_str(sub.ratings)
+        avg_ratings[idx] = sub.avg_rating
+        std_ratings[idx] = sub.std_rating
+        confidences[idx] = int_list_to_str(sub.confidences)
+        final_ratings[idx] = int_list_to_str(sub.final_ratings)
+        avg_finals[idx] = sub.avg_final_rating
+        std_finals[idx] = sub.std_final_rating
+
+    return pd.DataFrame(
+        {
+            "#": list(range(1, n + 1)),
+            "ID": ids,
+            "Title": titles,
+            "status": statuses,
+            "reviews_status": reviews_statuses,
+            "Meta_Prelim": meta_prelims,
+            "Meta_Final": meta_finals,
+            "Ratings": ratings,
+            "Avg_Rating": _format_floats(avg_ratings),
+            "Std_Rating": _format_floats(std_ratings),
+            "Confidences": confidences,
+            "Final_Ratings": final_ratings,
+            "Avg_Final": _format_floats(avg_finals),
+            "Std_Final": _format_floats(std_finals),
+        }
+    )
 
 
 def print_table(
@@ -170,96 +262,150 @@ def print_table(
     print_table_with_format(df, table_format)
 
 
-def print_table_with_format(df: pd.DataFrame, table_format: str) -> None:
+def print_table_with_format(df: "pd.DataFrame", table_format: str) -> None:
     """Print DataFrame with specified format."""
-    colalign = [
-        "right",
-        "right",
-        "left",
-        "right",
-        "left",
-        "left",
-        "left",
-        "right",
-        "right",
-        "right",
-        "right",
-        "right",
-        "right",
-        "right",
-    ]
+    if _ROW_COLOR_COLUMN in df.columns:
+        df = _colorize_dataframe(df)
+
+    from tabulate import tabulate
+
+    colalign = ["right", "right", "left", "right", "left", "left", "left"] + ["right"] * 8
 
     table_str = tabulate(
         df, headers="keys", tablefmt=table_format, showindex=False, colalign=colalign
     )
 
-    print(table_str)
-    print()
+    sys.stdout.write(f"{table_str}\n\n")
+
+
+def _write_csv_block(lines: list[str]) -> None:
+    """Write CSV lines framed by the CSV OUTPUT header in a single write."""
+    separator = "-" * 80
+    sys.stdout.write("\n".join([separator, "CSV OUTPUT", separator, *lines, separator]) + "\n")
+
+
+def _csv_line_formatter(include_urls: bool):
+    """Return a formatter for (color, #, ID, title, url, ratings, final ratings) CSV lines.
+
+    The identifying fields get the row color; the URL slot is skipped when URLs are off.
+    """
+    colored = "{0}{1}" + _END + ", {0}{2}" + _END + ", {0}{3}" + _END
+    return (colored + (", {4}, {5}, {6}" if include_urls else ", {5}, {6}")).format
 
 
 def print_csv(subs: list[Submission], include_urls: bool = False) -> None:
-    """Print submissions as CSV using pandas with color indicators."""
-    df = submissions_to_dataframe(subs, include_urls=include_urls)
+    """Print submissions as CSV with color indicators."""
+    fmt = _csv_line_formatter(include_urls)
+    lines = [
+        fmt(
+            _row_color(sub), idx, sub.sub_id, sub.title, sub.url,
+            int_list_to_str(sub.ratings), int_list_to_str(sub.final_ratings),
+        )
+        for idx, sub in enumerate(subs, 1)
+    ]
 
-    # Create CSV header
-    print("-" * 80)
-    print("CSV OUTPUT")
-    print("-" * 80)
+    _write_csv_block(lines)
 
-    # Print CSV format with color indicators
-    for _, row in df.iterrows():
-        # Extract raw ratings without color codes for CSV
-        import re
 
-        prelim_ratings_raw = re.sub(r"\033\[[0-9;]*m", "", row["Ratings"])
-        final_ratings_raw = re.sub(r"\033\[[0-9;]*m", "", row["Final_Ratings"])
-        url_raw = re.sub(r"\033\[[0-9;]*m", "", row["URL"]) if include_urls else ""
+def print_csv_df(df: "pd.DataFrame", include_urls: bool = False) -> None:
+    """Print a plain submissions DataFrame as CSV with row color indicators."""
+    # Pull the printed columns out as plain lists once instead of walking pandas objects
+    columns = (
+        df[column].tolist()
+        for column in (_ROW_COLOR_COLUMN, "#", "ID", "Title", "URL", "Ratings", "Final_Ratings")
+    )
 
-        if include_urls:
-            csv_line = f"{row['#']}, {row['ID']}, {row['Title']}, {url_raw}, {prelim_ratings_raw}, {final_ratings_raw}"
-        else:
-            csv_line = f"{row['#']}, {row['ID']}, {row['Title']}, {prelim_ratings_raw}, {final_ratings_raw}"
-        print(csv_line)
+    fmt = _csv_line_formatter(include_urls)
+    lines = [fmt(*row) for row in zip(*columns)]
 
-    print("-" * 80)
+    _write_csv_block(lines)
 
 
-def save_to_csv(subs: list[Submission], filename: str) -> None:
-    """Save submissions to CSV file without color codes."""
-    # Create clean DataFrame without color codes
-    clean_data = []
+def _submissions_to_clean_dataframe(subs: list[Submission]) -> "pd.DataFrame":
+    """Convert submissions list to a DataFrame without color codes for saving."""
+    import pandas as pd
+
+    n = len(subs)
+    ids, titles, urls, statuses = ([None] * n for _ in range(4))
+    meta_prelims, meta_finals = [""] * n, [""] * n
+    ratings, confidences, final_ratings = ([None] * n for _ in range(3))
+    avg_ratings, std_ratings, avg_finals, std_finals = (np.empty(n) for _ in range(4))
+
     for idx, sub in enumerate(subs):
         # Get meta-review decisions
-        meta_prelim_decision = ""
-        meta_final_decision = ""
-        if hasattr(sub, "meta_review") and sub.meta_review:
-            meta_prelim_decision = sub.meta_review.preliminary_decision or "N/A"
-            meta_final_decision = sub.meta_review.final_decision or "N/A"
-            
-        clean_data.append(
-            {
-                "#": idx + 1,
-                "ID": sub.sub_id,
-                "Title": sub.title,
-                "URL": getattr(sub, "url", ""),
-                "status": sub.status.value.upper(),
-                "Meta_Prelim": meta_prelim_decision,
-                "Meta_Final": meta_final_decision,
-                "Ratings": int_list_to_str(sub.ratings),
-                "Avg_Rating": f"{sub.avg_rating:.2f}",
-                "Std_Rating": f"{sub.std_rating:.2f}",
-                "Confidences": int_list_to_str(sub.confidences),
-                "Final_Ratings": int_list_to_str(sub.final_ratings),
-                "Avg_Final": f"{sub.avg_final_rating:.2f}",
-                "Std_Final": f"{sub.std_final_rating:.2f}",
-            }
-        )
+        if sub.meta_review:
+            meta_prelims[idx] = sub.meta_review.preliminary_decision or "N/A"
+            meta_finals[idx] = sub.meta_review.final_decision or "N/A"
+
+        ids[idx] = sub.sub_id
+        titles[idx] = sub.title
+        urls[idx] = sub.url
+        statuses[idx] = sub.status.value.upper()
+        ratings[idx] = int_list_to_str(sub.ratings)
+        avg_ratings[idx] = sub.avg_rating
+        std_ratings[idx] = sub.std_rating
+        confidences[idx] = int_list_to_str(sub.confidences)
+        final_ratings[idx] = int_list_to_str(sub.final_ratings)
+        avg_finals[idx] = sub.avg_final_rating
+        std_finals[idx] = sub.std_final_rating
+
+    return pd.DataFrame(
+        {
+            "#": list(range(1, n + 1)),
+            "ID": ids,
+            "Title": titles,
+            "URL": urls,
+            "status": statuses,
+            "Meta_Prelim": meta_prelims,
+            "Meta_Final": meta_finals,
+            "Ratings": ratings,
+            "Avg_Rating": _format_floats(avg_ratings),
+            "Std_Rating": _format_floats(std_ratings),
+            "Confidences": confidences,
+            "Final_Ratings": final_ratings,
+            "Avg_Final": _format_floats(avg_finals),
+            "Std_Final": _format_floats(std_finals),
+        }
+    )
+
 
-    df = pd.DataFrame(clean_data)
+def save_to_csv(subs: list[Submission], filename: str) -> None:
+    """Save submissions to CSV file without color codes."""
+    df = _submissions_to_clean_dataframe(subs)
+    # Always pandas: pyarrow's writer quotes every string, so output would
+    # depend on whether pyarrow happens to be installed
     df.to_csv(filename, index=False)
     print(f"Results saved to {filename}")
 
 
+def save_to_feather(subs: list[Submission], filename: str) -> None:
+    """Save submissions to a zstd-compressed Feather file (requires pyarrow)."""
+    df = _submissions_to_clean_dataframe(subs)
+    df.to_feather(filename, compression="zstd")
+    print(f"Results saved to {filename}")
+
+
+def save_submissions_arrow(subs: list[Submission], filename: str) -> None:
+    """Save full submissions (reviews as a nested column) to an Arrow IPC file."""
+    import pyarrow as pa
+
+    # Submission.model_dump is the display dict; pydantic's dump keeps every field
+    rows = [BaseModel.model_dump(sub, mode="json") for sub in subs]
+    table = pa.Table.from_pylist(rows)
+    with pa.OSFile(filename, "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+def load_submissions_arrow(filename: str) -> list[Submission]:
+    """Load submissions from an Arrow IPC file via a memory map."""
+    import pyarrow as pa
+
+    with pa.memory_map(filename, "r") as source:
+        rows = pa.ipc.open_file(source).read_all().to_pylist()
+    return [Submission.model_validate(row) for row in rows]
+
+
 def parse_display_args() -> argparse.Namespace:
     """Parse command line arguments for display operations."""
     parser = argparse.ArgumentParser(
@@ -271,7 +417,9 @@ def parse_display_args() -> argparse.Namespace:
         default="grid",
         help="Table format for display",
     )
-    parser.add_argument("--output", type=str, help="Save results to CSV file")
+    parser.add_argument(
+        "--output", type=str, help="Save results to CSV file (or Feather for .feather)"
+    )
     parser.add_argument("--csv-only", action="store_true", help="Only show CSV output")
     parser.add_argument(
         "--urls", action="store_true", help="Include clickable URLs in output"
@@ -290,19 +438,25 @@ def print_incomplete_ratings_table(
     # Filter submissions with incomplete ratings (excluding -1 values)
     incomplete_subs = []
     for sub in subs:
-        valid_prelim_ratings = [r for r in sub.ratings if r != -1]
-        valid_final_ratings = [r for r in sub.final_ratings if r != -1]
-        if len(valid_prelim_ratings) < 3 or len(valid_final_ratings) < 3:
+        if sub.num_valid_ratings < 3 or sub.num_valid_final_ratings < 3:
             incomplete_subs.append(sub)
-    
-    if not incomplete_subs:
+
+    _print_incomplete_rows(
+        _submissions_to_plain_dataframe(incomplete_subs, include_urls=include_urls), table_format
+    )
+
+
+def _print_incomplete_rows(df: "pd.DataFrame", table_format: str) -> None:
+    """Print the incomplete-ratings table from already filtered plain DataFrame rows."""
+    if df.empty:
         print(f"\n{Colors.GREEN}All submissions have complete ratings (≥ 3 ratings and final ratings){Colors.END}")
         return
     
-    print(f"\n{Colors.YELLOW}Submissions with Incomplete Ratings ({len(incomplete_subs)} submissions){Colors.END}")
-    print(f"{Colors.YELLOW}Showing submissions with < 3 ratings or < 3 final ratings{Colors.END}\n")
+    sys.stdout.write(
+        f"\n{Colors.YELLOW}Submissions with Incomplete Ratings ({len(df)} submissions){Colors.END}\n"
+        f"{Colors.YELLOW}Showing submissions with < 3 ratings or < 3 final ratings{Colors.END}\n\n"
+    )
     
-    df = submissions_to_dataframe(incomplete_subs, include_urls=include_urls)
     print_table_with_format(df, table_format)
 
 
@@ -321,66 +475,69 @@ def save_anonymized_reviews(subs: list[Submission], output_dir: str = "reviews")
         filename = f"{sub.sub_id}_{safe_title}.txt"
         filepath = os.path.join(output_dir, filename)
         
-        # Write anonymized reviews to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(f"Submission ID: {sub.sub_id}\n")
-            f.write(f"Title: {sub.title}\n")
-            f.write(f"URL: {getattr(sub, 'url', 'N/A')}\n")
-            
-            # Add meta-review if available
-            if hasattr(sub, 'meta_review') and sub.meta_review:
-                f.write(f"\n{'='*80}\n")
-                f.write("META REVIEW\n")
-                f.write(f"{'='*80}\n")
-                if sub.meta_review.preliminary_decision:
-                    f.write(f"Preliminary Decision: {sub.meta_review.preliminary_decision}\n")
-                if sub.meta_review.final_decision:
-                    f.write(f"Final Decision: {sub.meta_review.final_decision}\n")
-                if sub.meta_review.content:
-                    f.write(f"Content:\n{sub.meta_review.content}\n")
-                f.write(f"\n{'='*80}\n")
-            
-            f.write(f"\n{'='*80}\n")
-            f.write("REGULAR REVIEWS\n")
-            f.write(f"{'='*80}\n\n")
-            
-            for i, review in enumerate(sub.reviews, 1):
-                # Extract reviewer ID from format "id (reviewer_name)" and keep only the ID
-                reviewer_id = review.reviewer_id or f"Reviewer_{i}"
-                if ' (' in reviewer_id:
-                    reviewer_id = reviewer_id.split(' (')[0]
-                
-                f.write(f"REVIEWER {reviewer_id}\n")
-                f.write("-" * 40 + "\n")
-                
-                if review.paper_summary:
-                    f.write(f"Paper Summary:\n{review.paper_summary}\n\n")
-                
-                if review.preliminary_recommendation:
-                    f.write(f"Preliminary Recommendation: {review.preliminary_recommendation}\n")
-                
-                if review.justification_for_recommendation:
-                    f.write(f"Justification: {review.justification_for_recommendation}\n")
-                
-                if review.confidence_level:
-                    f.write(f"Confidence Level: {review.confidence_level}\n")
-                
-                if review.paper_strengths:
-                    f.write(f"Strengths: {review.paper_strengths}\n")
-                
-                if review.major_weaknesses:
-                    f.write(f"Major Weaknesses: {review.major_weaknesses}\n")
-                
-                if review.minor_weaknesses:
-                    f.write(f"Minor Weaknesses: {review.minor_weaknesses}\n")
-                
-                if review.final_recommendation:
-                    f.write(f"Final Recommendation: {review.final_recommendation}\n")
-                
-                if review.final_justification:
-                    f.write(f"Final Justification: {review.final_justification}\n")
-                
-                f.write("\n" + "=" * 80 + "\n\n")
+        # Build the file content in memory and write it in one go
+        parts = []
+        parts.append(f"Submission ID: {sub.sub_id}\n")
+        parts.append(f"Title: {sub.title}\n")
+        parts.append(f"URL: {sub.url}\n")
+
+        # Add meta-review if available
+        if sub.meta_review:
+            parts.append(f"\n{'='*80}\n")
+            parts.append("META REVIEW\n")
+            parts.append(f"{'='*80}\n")
+            if sub.meta_review.preliminary_decision:
+                parts.append(f"Preliminary Decision: {sub.meta_review.preliminary_decision}\n")
+            if sub.meta_review.final_decision:
+                parts.append(f"Final Decision: {sub.meta_review.final_decision}\n")
+            if sub.meta_review.content:
+                parts.append(f"Content:\n{sub.meta_review.content}\n")
+            parts.append(f"\n{'='*80}\n")
+
+        parts.append(f"\n{'='*80}\n")
+        parts.append("REGULAR REVIEWS\n")
+        parts.append(f"{'='*80}\n\n")
+
+        for i, review in enumerate(sub.reviews, 1):
+            # Extract reviewer ID from format "id (reviewer_name)" and keep only the ID
+            reviewer_id = review.reviewer_id or f"Reviewer_{i}"
+            if ' (' in reviewer_id:
+                reviewer_id = reviewer_id.split(' (')[0]
+
+            parts.append(f"REVIEWER {reviewer_id}\n")
+            parts.append("-" * 40 + "\n")
+
+            if review.paper_summary:
+                parts.append(f"Paper Summary:\n{review.paper_summary}\n\n")
+
+            if review.preliminary_recommendation:
+                parts.append(f"Preliminary Recommendation: {review.preliminary_recommendation}\n")
+
+            if review.justification_for_recommendation:
+                parts.append(f"Justification: {review.justification_for_recommendation}\n")
+
+            if review.confidence_level:
+                parts.append(f"Confidence Level: {review.confidence_level}\n")
+
+            if review.paper_strengths:
+                parts.append(f"Strengths: {review.paper_strengths}\n")
+
+            if review.major_weaknesses:
+                parts.append(f"Major Weaknesses: {review.major_weaknesses}\n")
+
+            if review.minor_weaknesses:
+                parts.append(f"Minor Weaknesses: {review.minor_weaknesses}\n")
+
+            if review.final_recommendation:
+                parts.append(f"Final Recommendation: {review.final_recommendation}\n")
+
+            if review.final_justification:
+                parts.append(f"Final Justification: {review.final_justification}\n")
+
+            parts.append("\n" + "=" * 80 + "\n\n")
+        
+        with open(filepath, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write("".join(parts))
         
         print(f"Saved anonymized reviews for {sub.sub_id} to {filepath}")
 
@@ -402,15 +559,27 @@ def display_results(
     include_urls = True  # getattr(args, 'urls', False)
 
     if not csv_only:
-        print_table(subs, table_format, include_urls=include_urls)
+        # Build the DataFrame once; the table colorizes it, the CSV output uses raw values
+        df = _submissions_to_plain_dataframe(subs, include_urls=include_urls)
+        print_table_with_format(df, table_format)
         
-        # Show incomplete ratings table
-        print_incomplete_ratings_table(subs, table_format, include_urls=include_urls)
+        # Show incomplete ratings table, reusing the rows built above (red rows are incomplete)
+        _print_incomplete_rows(df[df[_ROW_COLOR_COLUMN] == _RED], table_format)
 
-    print_csv(subs, include_urls=include_urls)
+        print_csv_df(df, include_urls=include_urls)
+    else:
+        # CSV-only output does not need pandas at all
+        print_csv(subs, include_urls=include_urls)
 
     if output_file:
-        save_to_csv(subs, output_file)
+        if output_file.endswith(".feather"):
+            if PYARROW_AVAILABLE:
+                save_to_feather(subs, output_file)
+            else:
+                print("❌ Feather output requires pyarrow. Install with:")
+                print("   pip install 'ac-conference-helper[arrow]'")
+        else:
+            save_to_csv(subs, output_file)
     
     # Save anonymized reviews if requested
     if save_reviews_dir:
@@ -2,7 +2,7 @@
 
 import json
 import os
-from typing import List, Dict, Optional, Any
+from typing import Iterator, List, Dict, Optional, Any
 from dataclasses import dataclass
 import time
 from dotenv import load_dotenv
@@ -178,14 +178,14 @@ Please provide your analysis based on the reviews above.
 
         return self.generate_response(user_prompt, system_prompt)
 
-    def chat_about_submission(
+    def _chat_messages(
         self,
         submission_title: str,
         reviews: List[str],
         user_question: str,
         chat_history: Optional[List[Dict]] = None,
-    ) -> str:
-        """Chat with LLM about a specific submission."""
+    ) -> List[Dict[str, str]]:
+        """Build the chat messages for a question about a submission."""
 
         reviews_text = "\n\n".join(
             [f"Review {i+1}:\n{review}" for i, review in enumerate(reviews)]
@@ -209,6 +209,19 @@ Answer the user's questions about this paper based on the provided reviews. Be h
 
         # Add current question
         messages.append({"role": "user", "content": user_question})
+        return messages
+
+    def chat_about_submission(
+        self,
+        submission_title: str,
+        reviews: List[str],
+        user_question: str,
+        chat_history: Optional[List[Dict]] = None,
+    ) -> str:
+        """Chat with LLM about a specific submission."""
+        messages = self._chat_messages(
+            submission_title, reviews, user_question, chat_history
+        )
 
         try:
             response = self.client.chat(model=self.config.model, messages=messages)
@@ -216,6 +229,28 @@ Answer the user's questions about this paper based on the provided reviews. Be h
         except Exception as e:
             return f"Error generating response: {e}"
 
+    def stream_chat_about_submission(
+        self,
+        submission_title: str,
+        reviews: List[str],
+        user_question: str,
+        chat_history: Optional[List[Dict]] = None,
+    ) -> Iterator[str]:
+        """Chat with LLM about a submission, yielding the response as it is generated.
+
+        Unlike chat_about_submission, errors are raised rather than returned as text.
+        """
+        messages = self._chat_messages(
+            submission_title, reviews, user_question, chat_history
+        )
+
+        for chunk in self.client.chat(
+            model=self.config.model, messages=messages, stream=True
+        ):
+            content = chunk["message"]["content"]
+            if content:
+                yield content
+
 
 def create_llm_client_from_env() -> OllamaClient:
     """Create LLM client from environment variables."""
@@ -1,17 +1,22 @@
 """Data models for conference submission data."""
 
+from functools import cached_property, lru_cache
 from typing import Optional, List
 from pydantic import BaseModel, Field
-from enum import Enum
+from enum import Enum, IntEnum
 import re
-import io
-from contextlib import redirect_stdout
 import numpy as np
-import pandas as pd
 
 # Import logging configuration
 from ac_conference_helper.utils.logging_config import get_logger
 
+# Use RE2 (google-re2) for the module's patterns when installed; its API
+# matches the subset of `re` used here, and patterns set flags inline.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
 # Configure structured logging
 logger = get_logger(__name__)
 
@@ -31,9 +36,99 @@ def int_list_to_str(ints: list[int]) -> str:
     return output
 
 
-class Review(BaseModel):
+def _trunc(text: str, n: int = 80) -> str:
+    """Truncate text to n characters, appending an ellipsis when cut."""
+    return text if len(text) <= n else text[:n] + "..."
+
+
+def _format_two_col_table(rows: list[list[str]], headers: tuple[str, str]) -> str:
+    """Format label/value rows as a two-column table with right-aligned labels."""
+    width = max(len(headers[0]), *(len(label) for label, _ in rows))
+    lines = [f"{headers[0]:<{width}} {headers[1]}"]
+    lines.extend(f"{label:>{width}} {value}" for label, value in rows)
+    return "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def _cached_property_names(cls: type) -> tuple[str, ...]:
+    """Names of all functools.cached_property attributes defined on a class."""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property)
+    )
+
+
+class CachedPropertyModel(BaseModel):
+    """Base model that drops cached property values whenever a field is reassigned.
+
+    Copies made with model_copy(update=...) start with an empty cache as well.
+    In-place mutation of a field (e.g. appending to a list) is not detected.
+    Equality and pickling only consider the declared fields, never cached values.
+    """
+
+    def __eq__(self, other):
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        # Cached values (e.g. numpy arrays) live in __dict__ and must not be compared
+        return type(self) is type(other) and all(
+            self.__dict__.get(name) == other.__dict__.get(name)
+            for name in type(self).model_fields
+        )
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        cached = _cached_property_names(type(self))
+        state["__dict__"] = {
+            name: value for name, value in state["__dict__"].items() if name not in cached
+        }
+        return state
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._clear_cached_properties()
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._clear_cached_properties()
+        return copied
+
+    def _clear_cached_properties(self) -> None:
+        for cached_name in _cached_property_names(type(self)):
+            self.__dict__.pop(cached_name, None)
+
+
+# Map common rating strings to numbers
+_RATING_LOOKUP = {
+    "1: Reject": 1,
+    "2: Weak Reject": 2,
+    "3: Borderline Reject": 3,
+    "4: Borderline Accept": 4,
+    "5: Weak Accept": 5,
+    "6: Accept": 6,
+    "Reject": 1,
+    "Weak Reject": 2,
+    "Borderline Reject": 3,
+    "Borderline Accept": 4,
+    "Weak Accept": 5,
+    "Accept": 6,
+}
+
+# Longest keys first so "Weak Accept" wins over "Accept" at the same position
+_RATING_RE = _re_engine.compile(
+    "|".join(re.escape(key) for key in sorted(_RATING_LOOKUP, key=len, reverse=True))
+)
+_CONFIDENCE_RE = _re_engine.compile(r"(\d+)")
+
+
+class Review(CachedPropertyModel):
     """Class containing detailed review information."""
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     reviewer_id: Optional[str] = None
     submission_date: Optional[str] = None
     modified_date: Optional[str] = None
@@ -55,45 +150,31 @@ class Review(BaseModel):
         if not recommendation_text:
             return -1
 
-        # Map common rating strings to numbers
-        rating_map = {
-            "1: Reject": 1,
-            "2: Weak Reject": 2,
-            "3: Borderline Reject": 3,
-            "4: Borderline Accept": 4,
-            "5: Weak Accept": 5,
-            "6: Accept": 6,
-            "Reject": 1,
-            "Weak Reject": 2,
-            "Borderline Reject": 3,
-            "Borderline Accept": 4,
-            "Weak Accept": 5,
-            "Accept": 6,
-        }
+        match = _RATING_RE.search(recommendation_text)
+        return _RATING_LOOKUP[match.group(0)] if match else None
 
-        for rating_str, numeric in rating_map.items():
-            if rating_str in recommendation_text:
-                return numeric
-
-        return None
-
-    @property
+    @cached_property
     def numeric_rating_final_reccomendation(self) -> Optional[int]:
         """Extract numeric rating from final recommendation."""
         return self._extract_numeric_rating(self.final_recommendation)
 
-    @property
+    @cached_property
     def numeric_rating_preliminary_recommendation(self) -> Optional[int]:
         """Extract numeric rating from preliminary recommendation."""
         return self._extract_numeric_rating(self.preliminary_recommendation)
 
-    @property
+    @cached_property
     def numeric_confidence(self) -> Optional[int]:
         """Extract numeric confidence from confidence level."""
         if not self.confidence_level:
             return None
 
-        match = re.search(r"(\d+)", self.confidence_level)
+        # Fast path for the usual "N: Label" format
+        head = self.confidence_level.split(":", 1)[0].strip()
+        if head.isdecimal():
+            return int(head)
+
+        match = _CONFIDENCE_RE.search(self.confidence_level)
         return int(match.group(1)) if match else None
 
     def model_dump(self) -> dict:
@@ -119,113 +200,104 @@ class Review(BaseModel):
 
     def __str__(self) -> str:
         """String representation uses pretty print by default."""
-        # Capture pretty print output
-        import io
-        import sys
-        from contextlib import redirect_stdout
-
-        f = io.StringIO()
-        with redirect_stdout(f):
-            self.pretty_print()
-
-        return f.getvalue()
+        return self._pretty_str()
 
     def pretty_print(self) -> None:
         """Print review details as a formatted table."""
-        print(f"\n{'='*60}")
-        print(f"REVIEW BY: {self.reviewer_id or 'Unknown'}")
-        print(f"{'='*60}")
+        print(self._pretty_str(), end="")
+
+    def _pretty_str(self) -> str:
+        """Build the review details table printed by pretty_print."""
+        lines = ["", "=" * 60, f"REVIEW BY: {self.reviewer_id or 'Unknown'}", "=" * 60]
 
         # Create table data
         data = []
         if self.paper_summary:
-            data.append(
-                [
-                    "Paper Summary",
-                    (
-                        self.paper_summary[:80] + "..."
-                        if len(self.paper_summary) > 80
-                        else self.paper_summary
-                    ),
-                ]
-            )
+            data.append(["Paper Summary", _trunc(self.paper_summary)])
         if self.preliminary_recommendation:
             data.append(["Preliminary Recommendation", self.preliminary_recommendation])
         if self.justification_for_recommendation:
             data.append(
                 [
                     "Justification for Recommendation",
-                    (
-                        self.justification_for_recommendation[:80] + "..."
-                        if len(self.justification_for_recommendation) > 80
-                        else self.justification_for_recommendation
-                    ),
+                    _trunc(self.justification_for_recommendation),
                 ]
             )
         if self.confidence_level:
             data.append(["Confidence Level", self.confidence_level])
         if self.paper_strengths:
-            data.append(
-                [
-                    "Paper Strengths",
-                    (
-                        self.paper_strengths[:80] + "..."
-                        if len(self.paper_strengths) > 80
-                        else self.paper_strengths
-                    ),
-                ]
-            )
+            data.append(["Paper Strengths", _trunc(self.paper_strengths)])
         if self.major_weaknesses:
-            data.append(
-                [
-                    "Major Weaknesses",
-                    (
-                        self.major_weaknesses[:80] + "..."
-                        if len(self.major_weaknesses) > 80
-                        else self.major_weaknesses
-                    ),
-                ]
-            )
+            data.append(["Major Weaknesses", _trunc(self.major_weaknesses)])
         if self.minor_weaknesses:
-            data.append(
-                [
-                    "Minor Weaknesses",
-                    (
-                        self.minor_weaknesses[:80] + "..."
-                        if len(self.minor_weaknesses) > 80
-                        else self.minor_weaknesses
-                    ),
-                ]
-            )
+            data.append(["Minor Weaknesses", _trunc(self.minor_weaknesses)])
         if self.final_recommendation:
             data.append(["Final Recommendation", self.final_recommendation])
         if self.final_justification:
-            data.append(
-                [
-                    "Final Justification",
-                    (
-                        self.final_justification[:80] + "..."
-                        if len(self.final_justification) > 80
-                        else self.final_justification
-                    ),
-                ]
-            )
+            data.append(["Final Justification", _trunc(self.final_justification)])
 
         if data:
-            df = pd.DataFrame(data, columns=["Field", "Content"])
-            pd.set_option("display.max_colwidth", None)
-            pd.set_option("display.colheader_justify", "left")
-            print(df.to_string(index=False))
+            lines.append(_format_two_col_table(data, ("Field", "Content")))
         else:
-            print("No review data available")
-
-        print(f"{'='*60}\n")
-
-
-
-class MetaReview(BaseModel):
+            lines.append("No review data available")
+
+        lines.append(f"{'='*60}\n")
+        return "\n".join(lines) + "\n"
+
+
+def _decision_section_pattern(search_key: str) -> re.Pattern:
+    # Equivalent to r"{key}\s*(.*?)(?=\n|$)" with DOTALL, without lookahead (unsupported by RE2)
+    return _re_engine.compile(rf"(?i){re.escape(search_key)}\s*([^\n]*)")
+
+
+_DECISION_SECTION_PATTERNS = {
+    key: _decision_section_pattern(key)
+    for key in ("Preliminary Recommendation:", "Final Recommendation:")
+}
+
+# Decision phrases mapped to (priority, canonical label)
+_DECISION_LABELS = {
+    "clear accept": (0, "Clear Accept"),
+    "clear reject": (1, "Clear Reject"),
+    "needs discussion": (2, "Needs Discussion"),
+    "borderline": (2, "Needs Discussion"),
+    "discuss": (2, "Needs Discussion"),
+    "accept": (3, "Accept"),
+    "reject": (4, "Reject"),
+}
+_DECISION_RE = _re_engine.compile("(?i)" + "|".join(_DECISION_LABELS))
+
+
+class DecisionCategory(IntEnum):
+    """Coarse meta-review decision categories, usable as array codes."""
+    ACCEPT = 0
+    REJECT = 1
+    DISCUSSION = 2
+    OTHER = 3
+    MISSING = 4
+
+
+@lru_cache(maxsize=None)
+def classify_decision(decision: Optional[str]) -> DecisionCategory:
+    """Map a meta-review decision to its category (memoized per string)."""
+    if not decision:
+        return DecisionCategory.MISSING
+    decision = decision.casefold()
+    for category in (
+        DecisionCategory.ACCEPT,
+        DecisionCategory.REJECT,
+        DecisionCategory.DISCUSSION,
+    ):
+        if category.name.casefold() in decision:
+            return category
+    return DecisionCategory.OTHER
+
+
+class MetaReview(CachedPropertyModel):
     """Class containing meta-review information."""
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     content: Optional[str] = None
     preliminary_decision: Optional[str] = None
     final_decision: Optional[str] = None
@@ -237,8 +309,8 @@ class MetaReview(BaseModel):
             return None
 
         # Find the section after the search key
-        pattern = rf"{re.escape(search_key)}\s*(.*?)(?=\n|$)"
-        match = re.search(pattern, content_text, re.DOTALL | re.IGNORECASE)
+        pattern = _DECISION_SECTION_PATTERNS.get(search_key) or _decision_section_pattern(search_key)
+        match = pattern.search(content_text)
 
         if not match:
             return None
@@ -247,47 +319,51 @@ class MetaReview(BaseModel):
         if not decision_text:
             return None
 
-        decision_lower = decision_text.lower()
-
-        # Common decision patterns
-        if any(phrase in decision_lower for phrase in ["clear accept"]):
-            return "Clear Accept"
-        elif any(phrase in decision_lower for phrase in ["clear reject"]):
-            return "Clear Reject"
-        elif any(phrase in decision_lower for phrase in ["needs discussion", "borderline", "discuss"]):
-            return "Needs Discussion"
-        elif "accept" in decision_lower:
-            return "Accept"
-        elif "reject" in decision_lower:
-            return "Reject"
+        # Common decision patterns; the highest-priority phrase found wins
+        phrases = _DECISION_RE.findall(decision_text)
+        if phrases:
+            return min(_DECISION_LABELS[phrase.lower()] for phrase in phrases)[1]
 
         return decision_text
 
     def model_post_init(self, __context):
         """Extract decisions from content after initialization."""
         try:
-            self.preliminary_decision = self._extract_decision(self.content, "Preliminary Recommendation:")
-            self.final_decision = self._extract_decision(self.content, "Final Recommendation:")  # Often same for meta-reviews
+            preliminary_decision = self._extract_decision(self.content, "Preliminary Recommendation:")
+            final_decision = self._extract_decision(self.content, "Final Recommendation:")  # Often same for meta-reviews
         except Exception as e:
             # If decision extraction fails, set to None to prevent crashes
-            self.preliminary_decision = None
-            self.final_decision = None
+            preliminary_decision = None
+            final_decision = None
             logger.warning(f"Error extracting decisions from meta-review: {e}")
 
+        # The model is frozen, so derived fields bypass pydantic's __setattr__
+        object.__setattr__(self, "preliminary_decision", preliminary_decision)
+        object.__setattr__(self, "final_decision", final_decision)
+
+    @cached_property
+    def preliminary_category(self) -> DecisionCategory:
+        """Category of the preliminary decision."""
+        return classify_decision(self.preliminary_decision)
+
+    @cached_property
+    def final_category(self) -> DecisionCategory:
+        """Category of the final decision."""
+        return classify_decision(self.final_decision)
+
     def __str__(self) -> str:
         """String representation of meta-review."""
-        output = f"Meta Review:\n"
+        parts = ["Meta Review:\n"]
         if self.preliminary_decision:
-            output += f"Preliminary Decision: {self.preliminary_decision}\n"
+            parts.append(f"Preliminary Decision: {self.preliminary_decision}\n")
         if self.final_decision:
-            output += f"Final Decision: {self.final_decision}\n"
+            parts.append(f"Final Decision: {self.final_decision}\n")
         if self.content:
-            content_preview = self.content[:200] + "..." if len(self.content) > 200 else self.content
-            output += f"Content: {content_preview}\n"
-        return output
+            parts.append(f"Content: {_trunc(self.content, 200)}\n")
+        return "".join(parts)
 
 
-class Submission(BaseModel):
+class Submission(CachedPropertyModel):
     """Class containing submission details."""
 
     title: str
@@ -311,78 +387,116 @@ class Submission(BaseModel):
     def desk_rejected(self) -> bool:
         return self.status == SubmissionStatus.DESK_REJECTED
 
-    @property
-    def final_ratings(self) -> list[int]:
-        """Extract all final ratings from reviews."""
-        final_ratings = []
+    @cached_property
+    def _rating_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Extract ratings, confidences and final ratings from reviews in one pass."""
+        ratings, confidences, final_ratings = [], [], []
         for review in self.reviews:
+            rating = review.numeric_rating_preliminary_recommendation
+            if rating is not None:
+                ratings.append(rating)
+            confidence = review.numeric_confidence
+            if confidence is not None:
+                confidences.append(confidence)
             final_rating = review.numeric_rating_final_reccomendation
             if final_rating is not None:
                 final_ratings.append(final_rating)
-        return final_ratings
+
+        # Ratings are bounded to -1..6; confidences are free-form numbers
+        return (
+            np.asarray(ratings, dtype=np.int8),
+            np.asarray(confidences, dtype=np.int64),
+            np.asarray(final_ratings, dtype=np.int8),
+        )
+
+    @cached_property
+    def title_short(self) -> str:
+        """Title truncated to 50 characters for compact listings."""
+        return _trunc(self.title, 50)
+
+    @property
+    def rating_array(self) -> np.ndarray:
+        """Ratings as an int8 array (shared with the cache; do not modify)."""
+        return self._rating_arrays[0]
+
+    @property
+    def final_rating_array(self) -> np.ndarray:
+        """Final ratings as an int8 array (shared with the cache; do not modify)."""
+        return self._rating_arrays[2]
+
+    # The packed arrays are the cached form; lists are built on request
+    @property
+    def final_ratings(self) -> list[int]:
+        """Extract all final ratings from reviews."""
+        return self._rating_arrays[2].tolist()
 
     @property
     def ratings(self) -> list[int]:
         """Extract all ratings from reviews."""
-        ratings = []
-        for review in self.reviews:
-            rating = review.numeric_rating_preliminary_recommendation
-            if rating is not None:
-                ratings.append(rating)
-        return ratings
+        return self._rating_arrays[0].tolist()
 
     @property
     def confidences(self) -> list[int]:
         """Extract all confidences from reviews."""
-        confidences = []
-        for review in self.reviews:
-            confidence = review.numeric_confidence
-            if confidence is not None:
-                confidences.append(confidence)
-        return confidences
+        return self._rating_arrays[1].tolist()
 
-    @property
-    def final_ratings(self) -> list[int]:
-        """Extract all final ratings from reviews."""
-        final_ratings = []
-        for review in self.reviews:
-            final_rating = review.numeric_rating_final_reccomendation
-            if final_rating is not None:
-                final_ratings.append(final_rating)
-        return final_ratings
+    @cached_property
+    def num_valid_ratings(self) -> int:
+        """Count ratings that are not missing (-1)."""
+        return int(np.count_nonzero(self._rating_arrays[0] != -1))
+
+    @cached_property
+    def num_valid_final_ratings(self) -> int:
+        """Count final ratings that are not missing (-1)."""
+        return int(np.count_nonzero(self._rating_arrays[2] != -1))
 
     def model_post_init(self, __context):
         """Validate data after initialization."""
-        if len(self.ratings) != len(self.confidences):
+        ratings, confidences, _ = self._rating_arrays
+        if ratings.size != confidences.size:
             raise ValueError("Ratings and confidences must have same length")
 
-    @property
+    @cached_property
     def avg_rating(self) -> float:
         """Calculate average rating."""
-        return np.mean(self.ratings) if self.ratings else 0.0
+        ratings = self._rating_arrays[0]
+        return float(ratings.mean()) if ratings.size else 0.0
 
-    @property
+    @cached_property
     def std_rating(self) -> float:
         """Calculate standard deviation of ratings."""
-        return np.std(self.ratings) if self.ratings else 0.0
+        ratings = self._rating_arrays[0]
+        return float(ratings.std()) if ratings.size else 0.0
 
-    @property
+    @cached_property
     def avg_final_rating(self) -> float:
         """Calculate average final rating."""
-        return np.mean(self.final_ratings) if self.final_ratings else 0.0
+        final_ratings = self._rating_arrays[2]
+        return float(final_ratings.mean()) if final_ratings.size else 0.0
 
-    @property
+    @cached_property
     def std_final_rating(self) -> float:
         """Calculate standard deviation of final ratings."""
-        return np.std(self.final_ratings) if self.final_ratings else 0.0
+        final_ratings = self._rating_arrays[2]
+        return float(final_ratings.std()) if final_ratings.size else 0.0
 
-    @property
+    @cached_property
     def detailed_reviews_count(self) -> int:
         """Get count of detailed reviews."""
-        return len([r for r in self.reviews if r.final_recommendation])
+        return sum(1 for r in self.reviews if r.final_recommendation)
 
     def model_dump(self) -> dict:
         """Return model as dict with computed properties."""
+        dump = dict(self._model_dump_cache)
+        # Fresh nested containers, so callers can't modify the cached dump
+        for name in ("ratings", "confidences", "final_ratings"):
+            dump[name] = list(dump[name])
+        dump["reviews"] = [dict(review) for review in dump["reviews"]]
+        return dump
+
+    @cached_property
+    def _model_dump_cache(self) -> dict:
+        """Dict returned by model_dump, built once until a field is reassigned."""
         return {
             "title": self.title,
             "sub_id": self.sub_id,
@@ -403,29 +517,64 @@ class Submission(BaseModel):
             "status": self.status,
         }
 
+    @cached_property
+    def chat_context(self) -> dict:
+        """Submission snapshot sent to the LLM as chat context (shared; do not modify)."""
+        reviews = []
+        for i, review in enumerate(self.reviews):
+            content = "\n".join(
+                (
+                    f"Review {i+1}: {review.paper_summary or ''}",
+                    f"Preliminary Recommendation: {review.preliminary_recommendation or ''}",
+                    f"Justification: {review.justification_for_recommendation or ''}",
+                    f"Final Recommendation: {review.final_recommendation or ''}",
+                    f"Final Justification: {review.final_justification or ''}",
+                    f"Strengths: {review.paper_strengths or ''}",
+                    f"Weaknesses: {review.major_weaknesses or ''}",
+                    f"Minor Weaknesses: {review.minor_weaknesses or ''}",
+                )
+            )
+            reviews.append(
+                {
+                    "content": content,
+                    "reviewer_id": review.reviewer_id or f"reviewer_{i}",
+                    "submission_date": review.submission_date or "",
+                    "modified_date": review.modified_date or "",
+                    "review_index": i,
+                    "numeric_rating_preliminary_recommendation": review.numeric_rating_preliminary_recommendation,
+                    "numeric_rating_final_reccomendation": review.numeric_rating_final_reccomendation,
+                    "confidence_level": review.confidence_level,
+                }
+            )
+        return {
+            "submission_id": self.sub_id,
+            "title": self.title,
+            "avg_rating": self.avg_rating,
+            "avg_final_rating": self.avg_final_rating,
+            "pdf_url": self.pdf_url,
+            "rebuttal_url": self.rebuttal_url,
+            "reviews": reviews,
+        }
+
     def __str__(self) -> str:
         """String representation uses pretty print by default."""
-        # Capture pretty print output
-        f = io.StringIO()
-        with redirect_stdout(f):
-            self.pretty_print()
-
-        return f.getvalue()
+        return self._pretty_str()
 
     def info(self) -> str:
         return (
             f"ID: {self.sub_id}, {self.title}, "
             + f"Ratings: {self.ratings}, "
             + f"Avg: {self.avg_rating:.2f}, "
-            + f"Var: {np.var(self.ratings):.2f}"
+            + f"Var: {np.var(self.rating_array):.2f}"
         )
 
     def pretty_print(self) -> None:
         """Print submission details including reviews as formatted tables."""
-        print(f"\n{'='*80}")
-        print(f"SUBMISSION: {self.title}")
-        print(f"ID: {self.sub_id}")
-        print(f"{'='*80}")
+        print(self._pretty_str(), end="")
+
+    def _pretty_str(self) -> str:
+        """Build the submission summary and review tables printed by pretty_print."""
+        parts = [f"\n{'='*80}\nSUBMISSION: {self.title}\nID: {self.sub_id}\n{'='*80}\n"]
 
         # Basic submission info
         basic_data = [
@@ -439,20 +588,17 @@ class Submission(BaseModel):
             ["Detailed Reviews", str(self.detailed_reviews_count)],
         ]
 
-        basic_df = pd.DataFrame(basic_data, columns=["Metric", "Value"])
-        pd.set_option("display.colheader_justify", "left")
-        print("\nSUBMISSION SUMMARY:")
-        print(basic_df.to_string(index=False))
+        parts.append("\nSUBMISSION SUMMARY:\n")
+        parts.append(_format_two_col_table(basic_data, ("Metric", "Value")) + "\n")
 
         # Detailed reviews
         if self.reviews:
-            print(f"\n{'='*80}")
-            print("DETAILED REVIEWS:")
-            print(f"{'='*80}")
+            parts.append(f"\n{'='*80}\nDETAILED REVIEWS:\n{'='*80}\n")
 
             for i, review in enumerate(self.reviews, 1):
                 if review.final_recommendation:  # Only show reviews with actual content
-                    print(f"\n--- REVIEW {i} ---")
-                    review.pretty_print()
+                    parts.append(f"\n--- REVIEW {i} ---\n")
+                    parts.append(review._pretty_str())
 
-        print(f"\n{'='*80}\n")
+        parts.append(f"\n{'='*80}\n\n")
+        return "".join(parts)
@@ -1,9 +1,13 @@
 """Submission analysis module using LLM."""
 
 from typing import List, Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib.util import find_spec
 import json
 import os
+import time
 from tqdm import tqdm
 
 from ac_conference_helper.core.models import Submission, Review
@@ -16,8 +20,29 @@ from ac_conference_helper.utils.logging_config import get_logger
 # Configure structured logging
 logger = get_logger(__name__)
 
+ORJSON_AVAILABLE = find_spec("orjson") is not None
 
-@dataclass
+# (label, Review field) pairs combined into the text sent to the LLM
+_REVIEW_TEXT_FIELDS = (
+    ("Paper Summary", "paper_summary"),
+    ("Preliminary Recommendation", "preliminary_recommendation"),
+    ("Justification", "justification_for_recommendation"),
+    ("Strengths", "paper_strengths"),
+    ("Major Weaknesses", "major_weaknesses"),
+    ("Minor Weaknesses", "minor_weaknesses"),
+    ("Final Recommendation", "final_recommendation"),
+    ("Final Justification", "final_justification"),
+)
+
+
+@lru_cache(maxsize=8)
+def _load_raw_analyses(filepath: str, mtime: float) -> List[Dict[str, Any]]:
+    """Parse an analyses file; cached per (path, modification time)."""
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@dataclass(slots=True)
 class LLMAnalysis:
     """Container for LLM analysis results."""
 
@@ -30,7 +55,7 @@ class LLMAnalysis:
     processing_time: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class EnhancedSubmission:
     """Enhanced submission with LLM analysis."""
 
@@ -74,52 +99,14 @@ class SubmissionAnalyzer:
 
         for review in submission.reviews:
             # Combine different parts of the review into a coherent text
-            review_parts = []
-
-            if hasattr(review, "paper_summary") and review.paper_summary:
-                review_parts.append(f"Paper Summary: {review.paper_summary}")
-
-            if (
-                hasattr(review, "preliminary_recommendation")
-                and review.preliminary_recommendation
-            ):
-                review_parts.append(
-                    f"Preliminary Recommendation: {review.preliminary_recommendation}"
-                )
-
-            if (
-                hasattr(review, "justification_for_recommendation")
-                and review.justification_for_recommendation
-            ):
-                review_parts.append(
-                    f"Justification: {review.justification_for_recommendation}"
-                )
-
-            if hasattr(review, "paper_strengths") and review.paper_strengths:
-                review_parts.append(f"Strengths: {review.paper_strengths}")
-
-            if hasattr(review, "major_weaknesses") and review.major_weaknesses:
-                review_parts.append(f"Major Weaknesses: {review.major_weaknesses}")
-
-            if hasattr(review, "minor_weaknesses") and review.minor_weaknesses:
-                review_parts.append(f"Minor Weaknesses: {review.minor_weaknesses}")
-
-            if hasattr(review, "final_recommendation") and review.final_recommendation:
-                review_parts.append(
-                    f"Final Recommendation: {review.final_recommendation}"
-                )
-
-            if hasattr(review, "final_justification") and review.final_justification:
-                review_parts.append(
-                    f"Final Justification: {review.final_justification}"
-                )
+            review_parts = [
+                f"{label}: {value}"
+                for label, field_name in _REVIEW_TEXT_FIELDS
+                if (value := getattr(review, field_name))
+            ]
 
             # If no structured content, use raw content
-            if (
-                not review_parts
-                and hasattr(review, "raw_content")
-                and review.raw_content
-            ):
+            if not review_parts and review.raw_content:
                 review_parts.append(review.raw_content)
 
             if review_parts:
@@ -127,12 +114,39 @@ class SubmissionAnalyzer:
 
         return review_texts
 
+    def _run_analysis(
+        self,
+        submission: Submission,
+        review_texts: List[str],
+        analysis_type: str,
+        start_time: Optional[float] = None,
+    ) -> Optional[LLMAnalysis]:
+        """Run a single analysis type on a submission's reviews."""
+        if start_time is None:
+            start_time = time.time()
+
+        try:
+            result = self.llm_client.analyze_submission_reviews(
+                submission.title, review_texts, analysis_type
+            )
+        except Exception as e:
+            print(f"Error analyzing submission {submission.sub_id}: {e}")
+            return None
+
+        return LLMAnalysis(
+            submission_id=submission.sub_id,
+            submission_title=submission.title,
+            analysis_type=analysis_type,
+            result=result,
+            timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+            model_used=self.llm_client.config.model,
+            processing_time=time.time() - start_time,
+        )
+
     def analyze_submission(
         self, submission: Submission, analysis_types: List[str]
     ) -> EnhancedSubmission:
         """Analyze a submission with specified analysis types."""
-        import time
-
         # Validate analysis types
         invalid_types = [at for at in analysis_types if at not in AVAILABLE_ANALYSES]
         if invalid_types:
@@ -153,26 +167,12 @@ class SubmissionAnalyzer:
         for analysis_type in analysis_types:
             print(f"Analyzing submission {submission.sub_id} with {analysis_type}...")
 
-            try:
-                result = self.llm_client.analyze_submission_reviews(
-                    submission.title, review_texts, analysis_type
-                )
-
-                analysis = LLMAnalysis(
-                    submission_id=submission.sub_id,
-                    submission_title=submission.title,
-                    analysis_type=analysis_type,
-                    result=result,
-                    timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
-                    model_used=self.llm_client.config.model,
-                    processing_time=time.time() - start_time,
-                )
-
+            analysis = self._run_analysis(
+                submission, review_texts, analysis_type, start_time
+            )
+            if analysis is not None:
                 enhanced.add_analysis(analysis)
 
-            except Exception as e:
-                print(f"Error analyzing submission {submission.sub_id}: {e}")
-
         return enhanced
 
     def analyze_multiple_submissions(
@@ -195,19 +195,50 @@ class SubmissionAnalyzer:
             )
             return enhanced_submissions
 
-        for submission in tqdm(submissions, desc="Analyzing submissions"):
-            enhanced = self.analyze_submission(submission, analysis_types)
-            enhanced_submissions.append(enhanced)
+        # LLM calls are I/O bound, so run (submission, analysis type) pairs concurrently
+        max_workers = int(os.getenv("AC_LLM_CONCURRENCY", "4"))
+        results: Dict[tuple, LLMAnalysis] = {}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for index, submission in enumerate(submissions):
+                enhanced_submissions.append(
+                    EnhancedSubmission(original_submission=submission)
+                )
+                review_texts = self.extract_review_texts(submission)
+                if not review_texts:
+                    print(
+                        f"Warning: No review texts found for submission {submission.sub_id}"
+                    )
+                    continue
+
+                for analysis_type in analysis_types:
+                    future = executor.submit(
+                        self._run_analysis, submission, review_texts, analysis_type
+                    )
+                    futures[future] = (index, analysis_type)
+
+            for future in tqdm(
+                as_completed(futures), total=len(futures), desc="Analyzing submissions"
+            ):
+                analysis = future.result()
+                if analysis is not None:
+                    results[futures[future]] = analysis
+
+        # Attach analyses in input order, independent of completion order
+        for index, enhanced in enumerate(enhanced_submissions):
+            for analysis_type in analysis_types:
+                analysis = results.get((index, analysis_type))
+                if analysis is not None:
+                    enhanced.add_analysis(analysis)
 
         return enhanced_submissions
 
-    def save_analyses(
-        self, enhanced_submissions: List[EnhancedSubmission], filepath: str
-    ):
-        """Save analyses to file."""
-        data = []
+    @staticmethod
+    def _iter_analysis_records(enhanced_submissions: List[EnhancedSubmission]):
+        """Yield serializable records for analyzed submissions."""
         for enhanced in enhanced_submissions:
-            submission_data = {
+            yield {
                 "submission_id": enhanced.sub_id,
                 "title": enhanced.title,
                 "analyses": [
@@ -221,10 +252,30 @@ class SubmissionAnalyzer:
                     for analysis in enhanced.llm_analyses
                 ],
             }
-            data.append(submission_data)
 
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def save_analyses(
+        self, enhanced_submissions: List[EnhancedSubmission], filepath: str
+    ):
+        """Save analyses to file."""
+        records = self._iter_analysis_records(enhanced_submissions)
+
+        if ORJSON_AVAILABLE:
+            import orjson
+
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(list(records), option=orjson.OPT_INDENT_2))
+        else:
+            # Stream one record at a time, matching json.dump(indent=2) layout
+            with open(filepath, "w", encoding="utf-8") as f:
+                f.write("[")
+                for index, record in enumerate(records):
+                    f.write(",\n  " if index else "\n  ")
+                    f.write(
+                        json.dumps(record, indent=2, ensure_ascii=False).replace(
+                            "\n", "\n  "
+                        )
+                    )
+                f.write("\n]" if enhanced_submissions else "]")
 
         print(f"Saved {len(enhanced_submissions)} analyzed submissions to {filepath}")
 
@@ -233,8 +284,8 @@ class SubmissionAnalyzer:
         if not os.path.exists(filepath):
             return []
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Objects are rebuilt on every call, so the cached data is never mutated
+        data = _load_raw_analyses(filepath, os.path.getmtime(filepath))
 
         enhanced_submissions = []
 
@@ -1,6 +1,15 @@
 """Streamlit web interface for conference submission chat system."""
 
+import hashlib
+import heapq
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
 import streamlit as st
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
 import plotly.express as px
@@ -10,10 +19,13 @@ load_dotenv()
 
 from ac_conference_helper.core.submission_analyzer import SubmissionAnalyzer
 from ac_conference_helper.config.constants import AVAILABLE_ANALYSES
-from ac_conference_helper.core.llm_integration import create_llm_client_from_env
 from ac_conference_helper.core.chat_system import SubmissionChatSystem
-from ac_conference_helper.core.display import submissions_to_dataframe_streamlit
-from ac_conference_helper.core.models import SubmissionStatus
+from ac_conference_helper.core.display import (
+    PYARROW_AVAILABLE,
+    load_submissions_arrow,
+    submissions_to_dataframe_streamlit,
+)
+from ac_conference_helper.core.models import DecisionCategory, SubmissionStatus
 
 # Import logging configuration
 from ac_conference_helper.utils.logging_config import get_logger
@@ -29,48 +41,25 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS for better styling
-st.markdown(
-    """
-<style>
-.metric-card {
-    background-color: #f0f2f6;
-    border: 1px solid #e1e5e9;
-    border-radius: 0.5rem;
-    padding: 1rem;
-    margin-bottom: 1rem;
-}
-.rating-positive {
-    color: #28a745;
-    font-weight: bold;
-}
-.rating-negative {
-    color: #dc3545;
-    font-weight: bold;
-}
-.stDataFrame {
-    width: 100%;
-}
-.strikethrough-row {
-    text-decoration: line-through !important;
-    opacity: 0.6 !important;
-}
-.compact-metric {
-    font-size: 1.1rem;
-}
-.compact-metric-label {
-    font-size: 1rem;
-    font-weight: normal;
-}
-</style>
-""",
-    unsafe_allow_html=True,
-)
+
+# Custom CSS for better styling; only rules the app actually uses, since
+# Streamlit rebuilds the page each rerun and the block is re-sent every time
+_CUSTOM_CSS = "<style>.stDataFrame{width:100%;}</style>"
+
+# Chat messages kept per session; Streamlit never frees state of closed tabs
+MAX_CHAT_HISTORY = 20
+
+# Submission table rows sent to the browser per page
+SUBMISSIONS_PAGE_SIZE = 50
 
 
-@st.cache_data
+@st.cache_resource(show_spinner="Loading submissions…")
 def load_submissions():
-    """Load submissions from cache file."""
+    """Load submissions from cache file.
+
+    Cached as a shared resource (no per-access copy); callers must treat the
+    returned list as read-only.
+    """
     import pickle
     import os
     from glob import glob
@@ -78,20 +67,419 @@ def load_submissions():
     # Get cache directory from environment or use default
     cache_dir = os.getenv("CACHE_DIR", "cache")
 
-    # Find the most recent cache file
-    cache_files = glob(f"{cache_dir}/submissions_*.pkl")
+    # Find the most recent cache file; Arrow caches win over legacy pickles
+    cache_files = glob(f"{cache_dir}/submissions_*.arrow") if PYARROW_AVAILABLE else []
+    if not cache_files:
+        cache_files = glob(f"{cache_dir}/submissions_*.pkl")
     if not cache_files:
         return []
 
     cache_file = max(cache_files, key=os.path.getctime)
 
     try:
-        with open(cache_file, "rb") as f:
-            return pickle.load(f)
+        if cache_file.endswith(".arrow"):
+            submissions = load_submissions_arrow(cache_file)
+        else:
+            with open(cache_file, "rb") as f:
+                submissions = pickle.load(f)
     except Exception as e:
         st.error(f"Error loading submissions: {e}")
         return []
 
+    return submissions
+
+
+def _submissions_fingerprint(submissions) -> str:
+    """Content hash of everything the cached views derive from the submissions."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for sub in submissions:
+        meta_content = sub.meta_review.content if sub.meta_review else None
+        parts = [sub.sub_id, sub.title, sub.status.value, meta_content]
+        for review in sub.reviews:
+            parts += (
+                review.reviewer_id,
+                review.preliminary_recommendation,
+                review.final_recommendation,
+                review.confidence_level,
+            )
+        hasher.update(json.dumps(parts).encode())
+    return hasher.hexdigest()
+
+
+# Submission statuses as compact array codes
+_STATUS_CODES = {status: code for code, status in enumerate(SubmissionStatus)}
+
+
+@lru_cache(maxsize=None)
+def _is_strong_decision(decision: str) -> bool:
+    """Whether a decision is qualified as clear/strong (memoized per string)."""
+    decision_lower = decision.lower()
+    return "clear" in decision_lower or "strong" in decision_lower
+
+
+def _render_decision(decision: Optional[str], category: DecisionCategory) -> None:
+    """Render a meta-review decision styled by its category."""
+    if not decision:
+        st.write("N/A")
+        return
+    if category is DecisionCategory.ACCEPT:
+        if _is_strong_decision(decision):
+            st.success(f"✅ {decision}")
+        else:
+            st.info(f"📝 {decision}")
+    elif category is DecisionCategory.REJECT:
+        if _is_strong_decision(decision):
+            st.error(f"❌ {decision}")
+        else:
+            st.warning(f"⚠️ {decision}")
+    elif category is DecisionCategory.DISCUSSION:
+        st.warning(f"🔄 {decision}")
+    else:
+        st.write(decision)
+
+
+@st.cache_data(show_spinner=False)
+def _sidebar_stats(
+    fingerprint: str, _status_codes, _prelim_codes, _final_codes
+) -> dict:
+    """Compute the sidebar meta-review decision counters from the code arrays."""
+    # Meta-review decisions are counted for active papers only
+    active_mask = _status_codes == _STATUS_CODES[SubmissionStatus.ACTIVE]
+    num_categories = len(DecisionCategory)
+    prelim = np.bincount(_prelim_codes[active_mask], minlength=num_categories)
+    final = np.bincount(_final_codes[active_mask], minlength=num_categories)
+
+    stats = {}
+    for category in DecisionCategory:
+        if category is not DecisionCategory.OTHER:
+            name = category.name.lower()
+            stats[f"prelim_{name}"] = int(prelim[category])
+            stats[f"final_{name}"] = int(final[category])
+    return stats
+
+
+_STRUCK_ROW_STYLE = "text-decoration: line-through; opacity: 0.6; color: #666;"
+
+
+@st.cache_data(show_spinner=False)
+def _build_submissions_df(
+    fingerprint: str, sub_ids: tuple, include_urls: bool, _submissions
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Build the submissions table and its cell styles; cached on content and displayed IDs."""
+    df = submissions_to_dataframe_streamlit(_submissions, include_urls=include_urls)
+
+    # Strike through withdrawn and desk-rejected rows
+    struck = df["status"].str.contains("WITHDRAWN|DESK REJECTED").to_numpy()
+    row_styles = np.where(struck, _STRUCK_ROW_STYLE, "")
+    styles = np.repeat(row_styles[:, None], df.shape[1], axis=1)
+    return df, styles
+
+
+# Review scores shown on the rating distribution charts
+_RATING_SCORES = tuple(range(1, 7))
+
+
+def _valid_review_ratings(per_submission: list[np.ndarray]) -> np.ndarray:
+    """Concatenate per-submission rating arrays, dropping missing (-1) ratings."""
+    if not per_submission:
+        return np.empty(0, dtype=np.int8)
+    ratings = np.concatenate(per_submission)
+    return ratings[ratings != -1]
+
+
+def _rating_summary(ratings: np.ndarray) -> tuple[np.ndarray, float, float]:
+    """Per-score counts (scores 1-6) plus sample mean and std, NaN when undefined."""
+    counts = np.bincount(ratings, minlength=7)[1:]
+    mean = float(ratings.mean()) if ratings.size else float("nan")
+    std = float(ratings.std(ddof=1)) if ratings.size > 1 else float("nan")
+    return counts, mean, std
+
+
+@st.cache_data(show_spinner=False)
+def _analytics(
+    fingerprint: str,
+    _submissions,
+    _avg_ratings,
+    _prelim_codes,
+    _final_codes,
+) -> dict:
+    """Aggregate the analytics dashboard figures from the per-submission arrays."""
+    rating_counts, rating_mean, rating_std = _rating_summary(
+        _valid_review_ratings([sub.rating_array for sub in _submissions])
+    )
+    final_rating_counts, final_rating_mean, final_rating_std = _rating_summary(
+        _valid_review_ratings([sub.final_rating_array for sub in _submissions])
+    )
+
+    num_categories = len(DecisionCategory)
+    # Accept, reject and discussion counts, in DecisionCategory order
+    counted = DecisionCategory.OTHER
+    prelim = np.bincount(_prelim_codes, minlength=num_categories)[:counted]
+    final = np.bincount(_final_codes, minlength=num_categories)[:counted]
+
+    # Best and worst five rated submissions, ordered best first. Partial
+    # selection matches a full stable descending sort: ties keep load order.
+    rated = np.flatnonzero(_avg_ratings > 0).tolist()
+    rating_of = _avg_ratings.__getitem__
+    top_5 = heapq.nlargest(5, rated, key=rating_of)
+    bottom_5 = heapq.nsmallest(5, reversed(rated), key=rating_of)[::-1]
+
+    def rows(indices) -> list:
+        return [
+            (_submissions[i].sub_id, _submissions[i].title_short, float(_avg_ratings[i]))
+            for i in indices
+        ]
+
+    return {
+        "rating_counts": rating_counts,
+        "final_rating_counts": final_rating_counts,
+        "rating_mean": rating_mean,
+        "rating_std": rating_std,
+        "final_rating_mean": final_rating_mean,
+        "final_rating_std": final_rating_std,
+        "prelim_counts": prelim.tolist(),
+        "final_counts": final.tolist(),
+        "top_5": rows(top_5),
+        "bottom_5": rows(bottom_5),
+    }
+
+
+@st.cache_data(show_spinner=False)
+def _rating_changes(
+    fingerprint: str, threshold: float, _avg_ratings, _avg_final_ratings
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """Find papers whose average rating crossed the threshold after rebuttal.
+
+    Returns the indices of the improved and declined papers and the number
+    of papers with both preliminary and final ratings.
+    """
+    rated = (_avg_ratings > 0) & (_avg_final_ratings > 0)
+    was_below = _avg_ratings <= threshold
+    is_below = _avg_final_ratings <= threshold
+    improved = np.flatnonzero(rated & was_below & ~is_below)
+    declined = np.flatnonzero(rated & ~was_below & is_below)
+    return improved, declined, int(rated.sum())
+
+
+@st.cache_resource(show_spinner=False)
+def _bar_chart(x: tuple, y: tuple, x_label: str, y_label: str, title: str):
+    """Build (once per data and labels) a compact Plotly bar chart."""
+    fig = px.bar(x=list(x), y=list(y), labels={"x": x_label, "y": y_label}, title=title)
+    fig.update_layout(showlegend=False, height=300)
+    return fig
+
+
+def _submission_columns(submissions) -> dict[str, np.ndarray]:
+    """Build the parallel per-submission arrays in a single pass."""
+    avg_ratings, avg_final_ratings, review_counts = [], [], []
+    status_codes, prelim_codes, final_codes = [], [], []
+
+    for sub in submissions:
+        avg_ratings.append(sub.avg_rating)
+        avg_final_ratings.append(sub.avg_final_rating)
+        review_counts.append(len(sub.reviews))
+        status_codes.append(_STATUS_CODES[sub.status])
+        meta_review = sub.meta_review
+        if meta_review is None:
+            prelim_codes.append(DecisionCategory.MISSING)
+            final_codes.append(DecisionCategory.MISSING)
+        else:
+            prelim_codes.append(meta_review.preliminary_category)
+            final_codes.append(meta_review.final_category)
+
+    return {
+        "avg_ratings": np.array(avg_ratings, dtype=np.float64),
+        "avg_final_ratings": np.array(avg_final_ratings, dtype=np.float64),
+        "review_counts": np.array(review_counts, dtype=np.int16),
+        "status_codes": np.array(status_codes, dtype=np.int8),
+        "prelim_codes": np.array(prelim_codes, dtype=np.int8),
+        "final_codes": np.array(final_codes, dtype=np.int8),
+    }
+
+
+def _store_submissions(submissions) -> None:
+    """Store submissions and their lookup/filter structures in session state."""
+    st.session_state.submissions = submissions
+    st.session_state.sub_by_id = {sub.sub_id: sub for sub in submissions}
+    # Key for the process-wide data caches; changes whenever the content does
+    st.session_state.fingerprint = _submissions_fingerprint(submissions)
+    # Parallel arrays for vectorized filtering and aggregation
+    for name, column in _submission_columns(submissions).items():
+        st.session_state[name] = column
+    # Conference-wide status counts only change when submissions are reloaded
+    status_counts = np.bincount(
+        st.session_state.status_codes, minlength=len(_STATUS_CODES)
+    )
+    st.session_state.status_counts = {
+        status: int(status_counts[code]) for status, code in _STATUS_CODES.items()
+    }
+    st.session_state.total_reviews = int(
+        st.session_state.review_counts.sum(dtype=np.int64)
+    )
+
+
+def _valid_rating(rating: Optional[int]) -> Optional[int]:
+    """Map the missing-rating marker (-1) to None."""
+    return None if rating == -1 else rating
+
+
+@st.cache_data(show_spinner=False)
+def _reviewer_df(fingerprint: str, sub_id: str, _reviews) -> pd.DataFrame:
+    """Build the reviewers table for a submission; cached per (content hash, ID)."""
+    # Columnar construction with explicit dtypes skips pandas' type inference
+    return pd.DataFrame(
+        {
+            "Reviewer": [
+                review.reviewer_id or f"Reviewer_{i+1}"
+                for i, review in enumerate(_reviews)
+            ],
+            "Preliminary Rating": pd.array(
+                [
+                    _valid_rating(review.numeric_rating_preliminary_recommendation)
+                    for review in _reviews
+                ],
+                dtype="Int64",
+            ),
+            "Final Rating": pd.array(
+                [
+                    _valid_rating(review.numeric_rating_final_reccomendation)
+                    for review in _reviews
+                ],
+                dtype="Int64",
+            ),
+            "Confidence": [review.confidence_level or None for review in _reviews],
+            "Preliminary Recommendation": [
+                review.preliminary_recommendation or "N/A" for review in _reviews
+            ],
+            "Final Recommendation": [
+                review.final_recommendation or "N/A" for review in _reviews
+            ],
+        }
+    )
+
+
+def _render_review_details(review) -> None:
+    """Render one review's details inside its expander."""
+    col1a, col2a = st.columns(2)
+
+    with col1a:
+        st.write("**Ratings & Recommendations**")
+        if review.numeric_rating_preliminary_recommendation != -1:
+            st.write(f"📊 Preliminary Rating: {review.numeric_rating_preliminary_recommendation}")
+        if review.numeric_rating_final_reccomendation != -1:
+            st.write(f"📊 Final Rating: {review.numeric_rating_final_reccomendation}")
+        if review.confidence_level:
+            st.write(f"🎯 Confidence: {review.confidence_level}")
+
+        st.write("**Recommendations**")
+        if review.preliminary_recommendation:
+            st.write(f"📝 Preliminary: {review.preliminary_recommendation}")
+        if review.final_recommendation:
+            st.write(f"📝 Final: {review.final_recommendation}")
+
+    with col2a:
+        st.write("**Review Content**")
+        if review.paper_summary:
+            st.write("**📄 Summary:**")
+            st.write(review.paper_summary)
+
+        if review.justification_for_recommendation:
+            st.write("**💭 Justification:**")
+            st.write(review.justification_for_recommendation)
+
+        if review.final_justification:
+            st.write("**💭 Final Justification:**")
+            st.write(review.final_justification)
+
+        if review.paper_strengths:
+            st.write("**💪 Strengths:**")
+            st.write(review.paper_strengths)
+
+        if review.major_weaknesses:
+            st.write("**⚠️ Major Weaknesses:**")
+            st.write(review.major_weaknesses)
+
+        if review.minor_weaknesses:
+            st.write("**⚠️ Minor Weaknesses:**")
+            st.write(review.minor_weaknesses)
+
+    # Add submission info if available
+    if review.submission_date or review.modified_date:
+        st.write("**📅 Timeline:**")
+        if review.submission_date:
+            st.write(f"Submitted: {review.submission_date}")
+        if review.modified_date:
+            st.write(f"Modified: {review.modified_date}")
+
+
+def _decision_breakdown(counts: list, total: int) -> str:
+    """Format accept/reject/discussion counts with their shares as markdown."""
+    labels = ("✅ Accept", "❌ Reject", "🔄 Discussion")
+    return "\n\n".join(
+        f"{label}: {count} ({pct:.1f}%)"
+        for label, count, pct in zip(labels, counts, _percentages(counts, total))
+    )
+
+
+def _percentages(counts: tuple, total: int) -> np.ndarray:
+    """Express counts as percentages of total (all zeros when total is 0)."""
+    return np.divide(
+        np.asarray(counts, dtype=np.float64) * 100,
+        total,
+        out=np.zeros(len(counts)),
+        where=total > 0,
+    )
+
+
+@st.fragment
+def _render_rating_changes() -> None:
+    """Render the threshold-crossing analysis; the slider reruns only this fragment."""
+    # Add threshold slider
+    threshold = st.slider("Rating Threshold", min_value=1.0, max_value=6.0, value=4.0, step=0.1)
+
+    submissions = st.session_state.submissions
+    avg_ratings = st.session_state.avg_ratings
+    avg_final_ratings = st.session_state.avg_final_ratings
+    improved_papers, declined_papers, papers_with_ratings = _rating_changes(
+        st.session_state.fingerprint, threshold, avg_ratings, avg_final_ratings
+    )
+    improvement_rate, decline_rate = _percentages(
+        (improved_papers.size, declined_papers.size), papers_with_ratings
+    )
+
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(f"📈 Below {threshold} → Above {threshold}", len(improved_papers))
+    with col2:
+        st.metric(f"📉 Above {threshold} → Below {threshold}", len(declined_papers))
+    with col3:
+        st.metric("📊 Improvement Rate", f"{improvement_rate:.1f}%")
+    with col4:
+        st.metric("📉 Decline Rate", f"{decline_rate:.1f}%")
+
+    # Per-paper lists are only formatted when asked for; the fragment reruns
+    # on every slider move and the lists can be long
+    if (improved_papers.size or declined_papers.size) and st.toggle(
+        "Show papers", key="show_rating_change_papers"
+    ):
+        if improved_papers.size:
+            with st.expander(f"📈 Papers that improved from ≤{threshold} to >{threshold}", expanded=True):
+                st.markdown(
+                    "\n".join(
+                        f"- {submissions[i].sub_id}: {avg_ratings[i]:.2f} → {avg_final_ratings[i]:.2f} (+{avg_final_ratings[i] - avg_ratings[i]:.2f})"
+                        for i in improved_papers
+                    )
+                )
+
+        if declined_papers.size:
+            with st.expander(f"📉 Papers that declined from >{threshold} to ≤{threshold}", expanded=True):
+                st.markdown(
+                    "\n".join(
+                        f"- {submissions[i].sub_id}: {avg_ratings[i]:.2f} → {avg_final_ratings[i]:.2f} ({avg_final_ratings[i] - avg_ratings[i]:.2f})"
+                        for i in declined_papers
+                    )
+                )
 
 @st.cache_resource
 def get_analyzer():
@@ -99,8 +487,280 @@ def get_analyzer():
     return SubmissionAnalyzer()
 
 
+@st.cache_resource
+def _llm_pool() -> ThreadPoolExecutor:
+    """Process-wide worker pool so LLM calls don't block the script thread."""
+    return ThreadPoolExecutor(max_workers=int(os.getenv("AC_LLM_CONCURRENCY", "4")))
+
+
+# Quick-action buttons: (session key, button label, analysis type)
+_QUICK_ACTIONS = (
+    ("summary", "📝 Get Summary", AVAILABLE_ANALYSES[0]),
+    ("meta_review", "📋 Get Meta Review", AVAILABLE_ANALYSES[1]),
+    ("improvements", "💡 Get Improvements", AVAILABLE_ANALYSES[2]),
+)
+
+
+@st.cache_data(ttl=3600, max_entries=512, show_spinner=False)
+def _cached_chat(
+    sub_id: str,
+    question: str,
+    history_hash: str,
+    _llm_client,
+    _context,
+    _history,
+    _sink: list,
+) -> str:
+    """Memoize chat responses per submission, question and chat history.
+
+    Streamed chunks are appended to _sink as they arrive (not on cache hits).
+    """
+    stream = getattr(_llm_client, "stream_chat_about_submission", None)
+    if stream is not None:
+        for chunk in stream("", [_context], question, _history):
+            _sink.append(chunk)
+        return "".join(_sink)
+
+    response = _llm_client.chat_about_submission("", [_context], question, _history)
+    # The client reports failures as text; raise so they aren't cached
+    if response.startswith("Error generating response:"):
+        raise RuntimeError(response)
+    return response
+
+
+def _ask_llm(
+    llm_client, context: dict, question: str, history: list, sink: list
+) -> tuple:
+    """Run a chat request in the worker pool, returning (question, response)."""
+    history_hash = hashlib.blake2b(
+        json.dumps(history, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+    response = _cached_chat(
+        context["submission_id"],
+        question,
+        history_hash,
+        llm_client,
+        context,
+        history,
+        sink,
+    )
+    return question, response
+
+
+@st.fragment(run_every=1)
+def _poll_pending_llm_calls() -> None:
+    """Collect finished background LLM calls and rerun the app to show them."""
+    pending = st.session_state.pending_llm
+    finished = [key for key, (_, future) in pending.items() if future.done()]
+    if not finished:
+        # Show the chat answer generated so far while it streams in, unless it
+        # belongs to a paper that is no longer selected
+        chat = pending.get("chat")
+        if chat is not None and chat[0] == st.session_state.current_submission_id:
+            partial = "".join(st.session_state.chat_stream)
+            if partial:
+                st.write(f"**🤖 Assistant:** {partial}")
+        st.info(f"⏳ Waiting for {len(pending)} LLM request(s)...")
+        return
+
+    for key in finished:
+        sub_id, future = pending.pop(key)
+        # Results for a paper that is no longer selected would land in its chat
+        if sub_id != st.session_state.current_submission_id:
+            continue
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error("Background LLM call failed", key=key, error=str(e))
+            st.session_state.llm_errors.append(f"Error getting response: {e}")
+            continue
+
+        if key == "chat":
+            question, response = result
+            st.session_state.chat_history.append({"role": "user", "content": question})
+            st.session_state.chat_history.append(
+                {"role": "assistant", "content": response}
+            )
+            del st.session_state.chat_history[:-MAX_CHAT_HISTORY]
+        elif result.llm_analyses:
+            st.session_state[f"last_{key}"] = result.llm_analyses[0].result
+
+    st.rerun()
+
+
+@st.fragment
+def _render_analytics() -> None:
+    """Render the analytics dashboard; its widgets rerun only this fragment."""
+    st.header("📈 Analytics Dashboard")
+
+    if not st.session_state.submissions:
+        st.warning("No data available for analytics.")
+        return
+
+    submissions = st.session_state.submissions
+    total_submissions = len(submissions)
+    analytics = _analytics(
+        st.session_state.fingerprint,
+        submissions,
+        st.session_state.avg_ratings,
+        st.session_state.prelim_codes,
+        st.session_state.final_codes,
+    )
+
+    # Rating distribution
+    st.subheader("📊 Rating Distribution")
+
+    rating_counts = analytics["rating_counts"]
+    final_rating_counts = analytics["final_rating_counts"]
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        if rating_counts.any():
+            fig = _bar_chart(
+                _RATING_SCORES,
+                tuple(rating_counts.tolist()),
+                "Review Score",
+                "Review Count",
+                "Preliminary Ratings Distribution",
+            )
+            st.plotly_chart(fig, width='stretch')
+        else:
+            st.write("No ratings data")
+
+    with col2:
+        if final_rating_counts.any():
+            fig = _bar_chart(
+                _RATING_SCORES,
+                tuple(final_rating_counts.tolist()),
+                "Review Score",
+                "Review Count",
+                "Final Ratings Distribution",
+            )
+            st.plotly_chart(fig, width='stretch')
+        else:
+            st.write("No final ratings data")
+
+    # Statistics
+    st.subheader("📈 Overall Statistics")
+
+    if rating_counts.any():
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            st.metric("Avg Preliminary Rating", f"{analytics['rating_mean']:.2f}")
+
+        with col2:
+            st.metric("Std Dev Preliminary", f"{analytics['rating_std']:.2f}")
+
+        with col3:
+            st.metric("Avg Final Rating", f"{analytics['final_rating_mean']:.2f}")
+
+        with col4:
+            st.metric("Std Dev Final", f"{analytics['final_rating_std']:.2f}")
+
+    # Meta-Review Decision Statistics
+    st.subheader("📋 Meta-Review Decision Analysis")
+
+    prelim_accept, prelim_reject, prelim_discussion = analytics["prelim_counts"]
+    final_accept, final_reject, final_discussion = analytics["final_counts"]
+
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig = _bar_chart(
+            ("Accept", "Reject", "Discussion"),
+            (prelim_accept, prelim_reject, prelim_discussion),
+            "Decision Type",
+            "Count",
+            "Preliminary Meta-Review Decisions",
+        )
+        st.plotly_chart(fig, width='stretch')
+        
+        # Calculate percentages
+        total_prelim = prelim_accept + prelim_reject + prelim_discussion
+        st.subheader(f"Active papers:")
+        if total_prelim > 0:
+            st.markdown(_decision_breakdown(analytics["prelim_counts"], total_prelim))
+        else:
+            st.write("No preliminary meta-review decisions found")
+    
+    with col2:
+        fig = _bar_chart(
+            ("Accept", "Reject", "Discussion"),
+            (final_accept, final_reject, final_discussion),
+            "Decision Type",
+            "Count",
+            "Final Meta-Review Decisions",
+        )
+        st.plotly_chart(fig, width='stretch')
+        
+        # Calculate percentages
+        total_final = final_accept + final_reject + final_discussion
+        if total_final > 0:
+            st.markdown(_decision_breakdown(analytics["final_counts"], total_final))
+        else:
+            st.write("No final meta-review decisions found")
+
+    # Status Statistics
+    st.subheader("Status Analysis")
+    
+    status_counts = st.session_state.status_counts
+    withdrawn_count = status_counts[SubmissionStatus.WITHDRAWN]
+    desk_rejected_count = status_counts[SubmissionStatus.DESK_REJECTED]
+    active_count = status_counts[SubmissionStatus.ACTIVE]
+    withdrawal_percentage, desk_rejected_percentage, active_percentage = _percentages(
+        (withdrawn_count, desk_rejected_count, active_count), total_submissions
+    )
+
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Papers", total_submissions)
+    with col2:
+        st.metric("🚫 Withdrawn", f'{withdrawal_percentage:.2f}% ({withdrawn_count})')
+    with col3:
+        st.metric("📋 Desk Rejected", f'{desk_rejected_percentage:.2f}% ({desk_rejected_count})')
+    with col4:
+        st.metric("✅ Active", f'{active_percentage:.2f}% ({active_count})')
+    
+    # Rating Improvement Analysis
+    st.subheader("📈 Rating Improvement Analysis")
+    
+    _render_rating_changes()
+
+    # Top and bottom submissions
+    st.subheader("🏆 Top & Bottom Performers")
+
+    if analytics["top_5"]:
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.write("**🥇 Top 5 Submissions**")
+            st.markdown(
+                "\n".join(
+                    f"{i}. {sub_id} - {title} ({avg_rating:.2f})"
+                    for i, (sub_id, title, avg_rating) in enumerate(
+                        analytics["top_5"], 1
+                    )
+                )
+            )
+
+        with col2:
+            st.write("**📉 Bottom 5 Submissions**")
+            st.markdown(
+                "\n".join(
+                    f"{i}. {sub_id} - {title} ({avg_rating:.2f})"
+                    for i, (sub_id, title, avg_rating) in enumerate(
+                        analytics["bottom_5"], 1
+                    )
+                )
+            )
+
+
 def main():
     """Main Streamlit application."""
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
     st.title("Conference Submission Analytics")
     st.markdown(
         "Interactive analysis system for conference submissions with LLM-powered insights"
@@ -108,11 +768,12 @@ def main():
 
     # Initialize session state
     if "submissions" not in st.session_state:
-        st.session_state.submissions = load_submissions()
+        _store_submissions(load_submissions())
 
     if "chat_system" not in st.session_state:
+        # Reuse the process-wide LLM client instead of connecting per session
         st.session_state.chat_system = SubmissionChatSystem(
-            st.session_state.submissions
+            st.session_state.submissions, llm_client=get_analyzer().llm_client
         )
 
     if "current_submission_id" not in st.session_state:
@@ -121,14 +782,26 @@ def main():
     if "chat_history" not in st.session_state:
         st.session_state.chat_history = []
 
+    if "pending_llm" not in st.session_state:
+        st.session_state.pending_llm = {}
+        st.session_state.llm_errors = []
+        st.session_state.chat_stream = []
+
     # Sidebar for navigation
     with st.sidebar:
         st.header("🔧 Controls")
 
         # Refresh data button
         if st.button("🔄 Refresh Data", type="primary"):
-            st.session_state.submissions = load_submissions()
-            st.session_state.chat_system = SubmissionChatSystem(
+            load_submissions.clear()
+            _sidebar_stats.clear()
+            _build_submissions_df.clear()
+            _reviewer_df.clear()
+            _cached_chat.clear()
+            _analytics.clear()
+            _rating_changes.clear()
+            _store_submissions(load_submissions())
+            st.session_state.chat_system.update_submissions(
                 st.session_state.submissions
             )
             st.rerun()
@@ -136,7 +809,13 @@ def main():
         # Statistics
         st.subheader("📊 Statistics")
         total_submissions = len(st.session_state.submissions)
-        total_reviews = sum(len(sub.reviews) for sub in st.session_state.submissions)
+        stats = _sidebar_stats(
+            st.session_state.fingerprint,
+            st.session_state.status_codes,
+            st.session_state.prelim_codes,
+            st.session_state.final_codes,
+        )
+        total_reviews = st.session_state.total_reviews
 
         st.metric("Total Submissions", total_submissions)
         st.metric("Total Reviews", total_reviews)
@@ -145,96 +824,58 @@ def main():
         st.subheader("📋 Meta-Review Analysis")
         
         # Count meta-review decisions for active papers only (exclude withdrawn and desk rejected)
-        active_submissions = [sub for sub in st.session_state.submissions if sub.status == SubmissionStatus.ACTIVE]
+        prelim_accept = stats["prelim_accept"]
+        prelim_reject = stats["prelim_reject"]
+        prelim_discussion = stats["prelim_discussion"]
+        prelim_missing = stats["prelim_missing"]
         
-        prelim_accept = 0
-        prelim_reject = 0
-        prelim_discussion = 0
-        prelim_missing = 0
+        final_accept = stats["final_accept"]
+        final_reject = stats["final_reject"]
+        final_discussion = stats["final_discussion"]
+        final_missing = stats["final_missing"]
         
-        final_accept = 0
-        final_reject = 0
-        final_discussion = 0
-        final_missing = 0
-        
-        for sub in active_submissions:
-            if hasattr(sub, "meta_review") and sub.meta_review:
-                # Preliminary decisions
-                if sub.meta_review.preliminary_decision:
-                    prelim_lower = sub.meta_review.preliminary_decision.lower()
-                    if "accept" in prelim_lower:
-                        prelim_accept += 1
-                    elif "reject" in prelim_lower:
-                        prelim_reject += 1
-                    elif "discussion" in prelim_lower:
-                        prelim_discussion += 1
-                else:
-                    prelim_missing += 1
-                
-                # Final decisions
-                if sub.meta_review.final_decision:
-                    final_lower = sub.meta_review.final_decision.lower()
-                    if "accept" in final_lower:
-                        final_accept += 1
-                    elif "reject" in final_lower:
-                        final_reject += 1
-                    elif "discussion" in final_lower:
-                        final_discussion += 1
-                else:
-                    final_missing += 1
-            else:
-                prelim_missing += 1
-                final_missing += 1
-        
-        total_active = len(active_submissions)
+        status_counts = st.session_state.status_counts
+        total_active = status_counts[SubmissionStatus.ACTIVE]
         
+        # Percentage scale, guarding against no active papers
+        active_scale = 100.0 / total_active if total_active else 0.0
+
         # Display preliminary stats
-        st.write('<div class="compact-metric-label"><strong>Preliminary Decisions (Active Papers Only):</strong></div>', unsafe_allow_html=True)
+        st.markdown("**Preliminary Decisions (Active Papers Only):**")
         col_prelim1, col_prelim2, col_prelim3 = st.columns(3)
-        with col_prelim1:
-            st.markdown(f'<div class="compact-metric">Accept<br><strong>{prelim_accept/total_active*100:.1f}%</strong><small>({prelim_accept})</small></div>', unsafe_allow_html=True)
-        with col_prelim2:
-            st.markdown(f'<div class="compact-metric">Reject<br><strong>{prelim_reject/total_active*100:.1f}%</strong><small>({prelim_reject})</small></div>', unsafe_allow_html=True)
-        with col_prelim3:
-            st.markdown(f'<div class="compact-metric">Discussion<br><strong>{prelim_discussion/total_active*100:.1f}%</strong><small>({prelim_discussion})</small></div>', unsafe_allow_html=True)
+        col_prelim1.metric("Accept", f"{prelim_accept * active_scale:.1f}% ({prelim_accept})")
+        col_prelim2.metric("Reject", f"{prelim_reject * active_scale:.1f}% ({prelim_reject})")
+        col_prelim3.metric("Discussion", f"{prelim_discussion * active_scale:.1f}% ({prelim_discussion})")
         
         # Display final stats
-        st.write('<div class="compact-metric-label"><strong>Final Decisions (Active Papers Only):</strong></div>', unsafe_allow_html=True)
+        st.markdown("**Final Decisions (Active Papers Only):**")
         col_final1, col_final2, col_final3 = st.columns(3)
-        with col_final1:
-            st.markdown(f'<div class="compact-metric">Accept<br><strong>{final_accept/total_active*100:.1f}%</strong><small>({final_accept})</small></div>', unsafe_allow_html=True)
-        with col_final2:
-            st.markdown(f'<div class="compact-metric">Reject<br><strong>{final_reject/total_active*100:.1f}%</strong><small>({final_reject})</small></div>', unsafe_allow_html=True)
-        with col_final3:
-            st.markdown(f'<div class="compact-metric">Discussion<br><strong>{final_discussion/total_active*100:.1f}%</strong><small>({final_discussion})</small></div>', unsafe_allow_html=True)
+        col_final1.metric("Accept", f"{final_accept * active_scale:.1f}% ({final_accept})")
+        col_final2.metric("Reject", f"{final_reject * active_scale:.1f}% ({final_reject})")
+        col_final3.metric("Discussion", f"{final_discussion * active_scale:.1f}% ({final_discussion})")
         
         # Missing meta-reviews
-        st.write('<div class="compact-metric-label"><strong>Papers Missing Meta-Reviews:</strong></div>', unsafe_allow_html=True)
+        st.markdown("**Papers Missing Meta-Reviews:**")
         col_missing1, col_missing2 = st.columns(2)
-        with col_missing1:
-            st.markdown(f'<div class="compact-metric"><small>preliminary</small><br>{prelim_missing}</div>', unsafe_allow_html=True)
-        with col_missing2:
-            st.markdown(f'<div class="compact-metric"><small>final</small><br>{final_missing}</div>', unsafe_allow_html=True)
+        col_missing1.metric("Preliminary", prelim_missing)
+        col_missing2.metric("Final", final_missing)
 
         # Status statistics
-        withdrawn_count = sum(1 for sub in st.session_state.submissions if sub.status == SubmissionStatus.WITHDRAWN)
-        desk_rejected_count = sum(1 for sub in st.session_state.submissions if sub.status == SubmissionStatus.DESK_REJECTED)
-        active_count = sum(1 for sub in st.session_state.submissions if sub.status == SubmissionStatus.ACTIVE)
+        withdrawn_count = status_counts[SubmissionStatus.WITHDRAWN]
+        desk_rejected_count = status_counts[SubmissionStatus.DESK_REJECTED]
+        active_count = total_active
         
         # Calculate percentages
-        total_submissions = len(st.session_state.submissions)
-        withdrawn_pct = (withdrawn_count / total_submissions * 100) if total_submissions > 0 else 0
-        desk_rejected_pct = (desk_rejected_count / total_submissions * 100) if total_submissions > 0 else 0
-        active_pct = (active_count / total_submissions * 100) if total_submissions > 0 else 0
+        total_scale = 100.0 / total_submissions if total_submissions else 0.0
+        withdrawn_pct = withdrawn_count * total_scale
+        desk_rejected_pct = desk_rejected_count * total_scale
+        active_pct = active_count * total_scale
         
-        st.write('<div class="compact-metric-label"><strong>Status Distribution:</strong></div>', unsafe_allow_html=True)
+        st.markdown("**Status Distribution:**")
         col_status1, col_status2, col_status3 = st.columns(3)
-        with col_status1:
-            st.markdown(f'<div class="compact-metric">🚫<br><strong>{withdrawn_pct:.1f}%</strong><small>({withdrawn_count})</small></div>', unsafe_allow_html=True)
-        with col_status2:
-            st.markdown(f'<div class="compact-metric">📋<br><strong>{desk_rejected_pct:.1f}%</strong><small>({desk_rejected_count})</small></div>', unsafe_allow_html=True)
-        with col_status3:
-            st.markdown(f'<div class="compact-metric">✅<br><strong>{active_pct:.1f}%</strong><small>({active_count})</small></div>', unsafe_allow_html=True)
+        col_status1.metric("🚫", f"{withdrawn_pct:.1f}% ({withdrawn_count})")
+        col_status2.metric("📋", f"{desk_rejected_pct:.1f}% ({desk_rejected_count})")
+        col_status3.metric("✅", f"{active_pct:.1f}% ({active_count})")
 
         # Filter options
         st.subheader("🔍 Filters")
@@ -244,11 +885,11 @@ def main():
         min_reviews = st.slider("Minimum Number of Reviews", 0, 6, 0)
 
         # Apply filters
-        filtered_submissions = [
-            sub
-            for sub in st.session_state.submissions
-            if sub.avg_rating >= min_rating and len(sub.reviews) >= min_reviews
-        ]
+        keep = np.flatnonzero(
+            (st.session_state.avg_ratings >= min_rating)
+            & (st.session_state.review_counts >= min_reviews)
+        )
+        filtered_submissions = [st.session_state.submissions[i] for i in keep]
 
         st.write(
             f"Showing {len(filtered_submissions)} of {total_submissions} submissions"
@@ -267,33 +908,43 @@ def main():
             return
 
         # Create dataframe for display
-        df = submissions_to_dataframe_streamlit(filtered_submissions, include_urls=False)
-        
-        # Apply strikethrough styling using pandas style
-        def highlight_withdrawn(row):
-            styles = [''] * len(row)
-            status = row.get('status', '')
-            if 'WITHDRAWN' in status or 'DESK REJECTED' in status:
-                for i, col in enumerate(row.index):
-                    styles[i] = 'text-decoration: line-through; opacity: 0.6; color: #666;'
-            return styles
-        
-        # Apply styling and display
-        styled_df = df.style.apply(highlight_withdrawn, axis=1)
+        df, cell_styles = _build_submissions_df(
+            st.session_state.fingerprint,
+            tuple(sub.sub_id for sub in filtered_submissions),
+            False,
+            filtered_submissions,
+        )
         
-        # Display as interactive table with row selection
+        # Only the current page is serialized to the browser
+        num_pages = -(-len(df) // SUBMISSIONS_PAGE_SIZE)
+        page = 1
+        if num_pages > 1:
+            page = st.number_input("Page", min_value=1, max_value=num_pages, value=1)
+        page_start = (page - 1) * SUBMISSIONS_PAGE_SIZE
+        page_end = page_start + SUBMISSIONS_PAGE_SIZE
+        page_styles = cell_styles[page_start:page_end]
+
+        # Apply the precomputed strikethrough styling in one call
+        styled_df = df.iloc[page_start:page_end].style.apply(
+            lambda _: page_styles, axis=None
+        )
+
+        # Display as interactive table with row selection; one key per page so a
+        # selection never carries over to a different page
         event = st.dataframe(
             styled_df,
             width="stretch",
             hide_index=True,
             on_select="rerun",
             selection_mode="single-row",
+            key=f"submissions_table_{page}",
         )
 
         # Handle row selection
         if event.selection.rows:
-            selected_row_index = event.selection.rows[0]
-            selected_sub_id = df.iloc[selected_row_index]["ID"]
+            selected_row_index = page_start + event.selection.rows[0]
+            # Table rows follow filtered_submissions order
+            selected_sub_id = filtered_submissions[selected_row_index].sub_id
 
             if st.session_state.current_submission_id != selected_sub_id:
                 st.session_state.current_submission_id = selected_sub_id
@@ -306,19 +957,26 @@ def main():
             st.header("💬 Chat Analysis")
 
             # Get current submission
-            current_submission = next(
-                (
-                    sub
-                    for sub in st.session_state.submissions
-                    if sub.sub_id == st.session_state.current_submission_id
-                ),
-                None,
+            current_submission = st.session_state.sub_by_id.get(
+                st.session_state.current_submission_id
             )
 
             if not current_submission:
                 st.error("Submission not found!")
                 return
 
+            # Background LLM calls, tagged with the paper they were made for
+            pending = st.session_state.pending_llm
+            busy = {
+                key
+                for key, (sub_id, _) in pending.items()
+                if sub_id == current_submission.sub_id
+            }
+
+            pdf_url = current_submission.pdf_url
+            rebuttal_url = current_submission.rebuttal_url
+            url = current_submission.url
+
             # Display submission info in two columns
             col1, col2 = st.columns([3, 1])  # Give more space to col1, ensure col2 is visible
             
@@ -342,7 +1000,8 @@ def main():
                         st.success("✅ Active")
 
                 # Add meta-review information if available
-                if hasattr(current_submission, "meta_review") and current_submission.meta_review:
+                meta_review = current_submission.meta_review
+                if meta_review is not None:
                     st.subheader("📋 Meta Review")
                     
                     # Create two columns for preliminary and final decisions
@@ -350,77 +1009,29 @@ def main():
                     
                     with decision_cols[0]:
                         st.write("**Preliminary Decision:**")
-                        if current_submission.meta_review.preliminary_decision:
-                            decision = current_submission.meta_review.preliminary_decision.lower()
-                            if "accept" in decision:
-                                if "clear" in decision or "strong" in decision:
-                                    st.success(f"✅ {current_submission.meta_review.preliminary_decision}")
-                                else:
-                                    st.info(f"📝 {current_submission.meta_review.preliminary_decision}")
-                            elif "reject" in decision:
-                                if "clear" in decision or "strong" in decision:
-                                    st.error(f"❌ {current_submission.meta_review.preliminary_decision}")
-                                else:
-                                    st.warning(f"⚠️ {current_submission.meta_review.preliminary_decision}")
-                            elif "discussion" in decision:
-                                st.warning(f"🔄 {current_submission.meta_review.preliminary_decision}")
-                            else:
-                                st.write(current_submission.meta_review.preliminary_decision)
-                        else:
-                            st.write("N/A")
+                        _render_decision(
+                            meta_review.preliminary_decision,
+                            meta_review.preliminary_category,
+                        )
                     
                     with decision_cols[1]:
                         st.write("**Final Decision:**")
-                        if current_submission.meta_review.final_decision:
-                            decision = current_submission.meta_review.final_decision.lower()
-                            if "accept" in decision:
-                                if "clear" in decision or "strong" in decision:
-                                    st.success(f"✅ {current_submission.meta_review.final_decision}")
-                                else:
-                                    st.info(f"📝 {current_submission.meta_review.final_decision}")
-                            elif "reject" in decision:
-                                if "clear" in decision or "strong" in decision:
-                                    st.error(f"❌ {current_submission.meta_review.final_decision}")
-                                else:
-                                    st.warning(f"⚠️ {current_submission.meta_review.final_decision}")
-                            elif "discussion" in decision:
-                                st.warning(f"🔄 {current_submission.meta_review.final_decision}")
-                            else:
-                                st.write(current_submission.meta_review.final_decision)
-                        else:
-                            st.write("N/A")
+                        _render_decision(
+                            meta_review.final_decision, meta_review.final_category
+                        )
                     
-                    if current_submission.meta_review.content:
+                    if meta_review.content:
                         with st.expander("📄 Meta Review Content", expanded=False):
-                            st.write(current_submission.meta_review.content)
+                            st.write(meta_review.content)
 
                 # Add reviewers table
                 if current_submission.reviews:
                     st.subheader("👥 Reviewers")
-                    reviewer_data = []
-                    for i, review in enumerate(current_submission.reviews):
-                        reviewer_data.append(
-                            {
-                                "Reviewer": review.reviewer_id or f"Reviewer_{i+1}",
-                                "Preliminary Rating": (
-                                    review.numeric_rating_preliminary_recommendation
-                                    if review.numeric_rating_preliminary_recommendation != -1
-                                    else None
-                                ),
-                                "Final Rating": (
-                                    review.numeric_rating_final_reccomendation
-                                    if review.numeric_rating_final_reccomendation != -1
-                                    else None
-                                ),
-                                "Confidence": (
-                                    review.confidence_level if review.confidence_level else None
-                                ),
-                                "Preliminary Recommendation": review.preliminary_recommendation or "N/A",
-                                "Final Recommendation": review.final_recommendation or "N/A",
-                            }
-                        )
-
-                    reviewers_df = pd.DataFrame(reviewer_data)
+                    reviewers_df = _reviewer_df(
+                        st.session_state.fingerprint,
+                        current_submission.sub_id,
+                        current_submission.reviews,
+                    )
                     st.dataframe(reviewers_df, width="stretch", hide_index=True)
                     
                     # Add review content sections
@@ -428,102 +1039,40 @@ def main():
                     for i, review in enumerate(current_submission.reviews):
                         reviewer_name = review.reviewer_id or f"Reviewer_{i+1}"
                         with st.expander(f"📄 {reviewer_name} - Review Details", expanded=False):
-                            col1a, col2a = st.columns(2)
-                            
-                            with col1a:
-                                st.write("**Ratings & Recommendations**")
-                                if review.numeric_rating_preliminary_recommendation != -1:
-                                    st.write(f"📊 Preliminary Rating: {review.numeric_rating_preliminary_recommendation}")
-                                if review.numeric_rating_final_reccomendation != -1:
-                                    st.write(f"📊 Final Rating: {review.numeric_rating_final_reccomendation}")
-                                if review.confidence_level:
-                                    st.write(f"🎯 Confidence: {review.confidence_level}")
-                                
-                                st.write("**Recommendations**")
-                                if review.preliminary_recommendation:
-                                    st.write(f"📝 Preliminary: {review.preliminary_recommendation}")
-                                if review.final_recommendation:
-                                    st.write(f"📝 Final: {review.final_recommendation}")
-                            
-                            with col2a:
-                                st.write("**Review Content**")
-                                if review.paper_summary:
-                                    st.write("**📄 Summary:**")
-                                    st.write(review.paper_summary)
-                                
-                                if review.justification_for_recommendation:
-                                    st.write("**💭 Justification:**")
-                                    st.write(review.justification_for_recommendation)
-                                
-                                if review.final_justification:
-                                    st.write("**💭 Final Justification:**")
-                                    st.write(review.final_justification)
-                                
-                                if review.paper_strengths:
-                                    st.write("**💪 Strengths:**")
-                                    st.write(review.paper_strengths)
-                                
-                                if review.major_weaknesses:
-                                    st.write("**⚠️ Major Weaknesses:**")
-                                    st.write(review.major_weaknesses)
-                                
-                                if review.minor_weaknesses:
-                                    st.write("**⚠️ Minor Weaknesses:**")
-                                    st.write(review.minor_weaknesses)
-                            
-                            # Add submission info if available
-                            if review.submission_date or review.modified_date:
-                                st.write("**📅 Timeline:**")
-                                if review.submission_date:
-                                    st.write(f"Submitted: {review.submission_date}")
-                                if review.modified_date:
-                                    st.write(f"Modified: {review.modified_date}")
+                            _render_review_details(review)
 
             with col2:
                 # Quick analysis buttons
                 st.subheader("🚀 Quick Actions")
                 
                 # PDF and Rebuttal links
-                if hasattr(current_submission, "pdf_url") and current_submission.pdf_url:
-                    st.markdown(f'<a href="{current_submission.pdf_url}" target="_blank"><button style="background-color:#28a745;color:white;border:none;padding:6px 12px;border-radius:4px;cursor:pointer;margin:2px 0;">📕 PDF</button></a>', unsafe_allow_html=True)
-                if hasattr(current_submission, "rebuttal_url") and current_submission.rebuttal_url:
-                    st.markdown(f'<a href="{current_submission.rebuttal_url}" target="_blank"><button style="background-color:#17a2b8;color:white;border:none;padding:6px 12px;border-radius:4px;cursor:pointer;margin:2px 0;">📄 Rebuttal</button></a>', unsafe_allow_html=True)
+                if pdf_url:
+                    st.markdown(f'<a href="{pdf_url}" target="_blank"><button style="background-color:#28a745;color:white;border:none;padding:6px 12px;border-radius:4px;cursor:pointer;margin:2px 0;">📕 PDF</button></a>', unsafe_allow_html=True)
+                if rebuttal_url:
+                    st.markdown(f'<a href="{rebuttal_url}" target="_blank"><button style="background-color:#17a2b8;color:white;border:none;padding:6px 12px;border-radius:4px;cursor:pointer;margin:2px 0;">📄 Rebuttal</button></a>', unsafe_allow_html=True)
 
-                if current_submission.url:
-                    st.markdown(f'<a href="{current_submission.url}" target="_blank"><button style="background-color:#0066cc;color:white;border:none;padding:6px 12px;border-radius:4px;cursor:pointer;margin:2px 0;">🔗 OpenReview</button></a>', unsafe_allow_html=True)
+                if url:
+                    st.markdown(f'<a href="{url}" target="_blank"><button style="background-color:#0066cc;color:white;border:none;padding:6px 12px;border-radius:4px;cursor:pointer;margin:2px 0;">🔗 OpenReview</button></a>', unsafe_allow_html=True)
                 else:
                     st.warning("No OpenReview link available")
 
-                if st.button("📝 Get Summary", key="summary"):
-                    with st.spinner("Analyzing..."):
-                        analyzer = get_analyzer()
-                        enhanced = analyzer.analyze_submission(
-                            current_submission, [AVAILABLE_ANALYSES[0]]  # summary
-                        )
-                        if enhanced.llm_analyses:
-                            st.success("Summary generated!")
-                            st.session_state.last_summary = enhanced.llm_analyses[0].result
-
-                if st.button("📋 Get Meta Review", key="meta_review"):
-                    with st.spinner("Analyzing..."):
-                        analyzer = get_analyzer()
-                        enhanced = analyzer.analyze_submission(
-                            current_submission, [AVAILABLE_ANALYSES[1]]  # meta_review
-                        )
-                        if enhanced.llm_analyses:
-                            st.success("Meta review generated!")
-                            st.session_state.last_meta_review = enhanced.llm_analyses[0].result
-
-                if st.button("💡 Get Improvements", key="improvements"):
-                    with st.spinner("Analyzing..."):
-                        analyzer = get_analyzer()
-                        enhanced = analyzer.analyze_submission(
-                            current_submission, [AVAILABLE_ANALYSES[2]]  # improvement_suggestions
+                run_all = st.button(
+                    "🚀 Run All Analyses",
+                    key="run_all_analyses",
+                    disabled=all(key in busy for key, _, _ in _QUICK_ACTIONS),
+                )
+                for key, label, analysis_type in _QUICK_ACTIONS:
+                    clicked = st.button(label, key=key, disabled=key in busy)
+                    # Each analysis is its own pool task, so "run all" runs them concurrently
+                    if (clicked or run_all) and key not in busy:
+                        pending[key] = (
+                            current_submission.sub_id,
+                            _llm_pool().submit(
+                                get_analyzer().analyze_submission,
+                                current_submission,
+                                [analysis_type],
+                            ),
                         )
-                        if enhanced.llm_analyses:
-                            st.success("Improvement suggestions generated!")
-                            st.session_state.last_improvements = enhanced.llm_analyses[0].result
-
 
             # Chat interface below the submission info
             if hasattr(st.session_state, "last_summary"):
@@ -556,325 +1105,42 @@ def main():
                 "Ask about this submission:", key="chat_input"
             )
 
-            if st.button("Send", key="send_button") and user_question:
-                with st.spinner("Thinking..."):
-                    try:
-                        # Create context for LLM
-                        context = {
-                            "submission_id": current_submission.sub_id,
-                            "title": current_submission.title,
-                            "avg_rating": current_submission.avg_rating,
-                            "avg_final_rating": current_submission.avg_final_rating,
-                            "pdf_url": getattr(current_submission, "pdf_url", None),
-                            "rebuttal_url": getattr(
-                                current_submission, "rebuttal_url", None
-                            ),
-                            "reviews": [],
-                        }
-
-                        # Add reviews to context
-                        for i, review in enumerate(current_submission.reviews):
-                            context["reviews"].append(
-                                {
-                                    "content": f"Review {i+1}: {review.paper_summary or ''}\n"
-                                    f"Preliminary Recommendation: {review.preliminary_recommendation or ''}\n"
-                                    f"Justification: {review.justification_for_recommendation or ''}\n"
-                                    f"Final Recommendation: {review.final_recommendation or ''}\n"
-                                    f"Final Justification: {review.final_justification or ''}\n"
-                                    f"Strengths: {review.paper_strengths or ''}\n"
-                                    f"Weaknesses: {review.major_weaknesses or ''}\n"
-                                    f"Minor Weaknesses: {review.minor_weaknesses or ''}",
-                                    "reviewer_id": review.reviewer_id
-                                    or f"reviewer_{i}",
-                                    "submission_date": review.submission_date or "",
-                                    "modified_date": review.modified_date or "",
-                                    "review_index": i,
-                                    "numeric_rating_preliminary_recommendation": review.numeric_rating_preliminary_recommendation,
-                                    "numeric_rating_final_reccomendation": review.numeric_rating_final_reccomendation,
-                                    "confidence_level": review.confidence_level,
-                                }
-                            )
-
-                        # Get LLM response
-                        llm_client = create_llm_client_from_env()
-                        response = llm_client.chat_about_submission(
-                            "", [context], user_question, st.session_state.chat_history
-                        )
+            send_clicked = st.button(
+                "Send", key="send_button", disabled="chat" in busy
+            )
+            if send_clicked and user_question:
+                try:
+                    # Hand the LLM call to the worker pool; the poller shows the
+                    # streamed answer and collects it when done
+                    st.session_state.chat_stream = []
+                    pending["chat"] = (
+                        current_submission.sub_id,
+                        _llm_pool().submit(
+                            _ask_llm,
+                            get_analyzer().llm_client,
+                            current_submission.chat_context,
+                            user_question,
+                            list(st.session_state.chat_history),
+                            st.session_state.chat_stream,
+                        ),
+                    )
 
-                        # Add to chat history
-                        st.session_state.chat_history.append(
-                            {"role": "user", "content": user_question}
-                        )
-                        st.session_state.chat_history.append(
-                            {"role": "assistant", "content": response}
-                        )
+                except Exception as e:
+                    st.error(f"Error getting response: {e}")
 
-                        st.success("Response received!")
-                        st.rerun()
+            for message in st.session_state.llm_errors:
+                st.error(message)
+            st.session_state.llm_errors.clear()
 
-                    except Exception as e:
-                        st.error(f"Error getting response: {e}")
+            if pending:
+                _poll_pending_llm_calls()
         else:
             st.info(
                 "👆 Click on a row in the table above to start chatting about that submission."
             )
 
     with tab2:
-        st.header("📈 Analytics Dashboard")
-
-        if not st.session_state.submissions:
-            st.warning("No data available for analytics.")
-            return
-
-        # Rating distribution
-        st.subheader("📊 Rating Distribution")
-
-        all_ratings = []
-        all_final_ratings = []
-
-        for sub in st.session_state.submissions:
-            all_ratings.extend([r for r in sub.ratings if r != -1])
-            all_final_ratings.extend([r for r in sub.final_ratings if r != -1])
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            if all_ratings:
-                rating_counts = pd.Series(all_ratings).value_counts().sort_index()
-                
-                # Create a more detailed chart with axis labels
-                fig = px.bar(
-                    x=rating_counts.index, 
-                    y=rating_counts.values,
-                    labels={"x": "Review Score", "y": "Review Count"},
-                    title="Preliminary Ratings Distribution"
-                )
-                fig.update_layout(showlegend=False, height=300)
-                st.plotly_chart(fig, width='stretch')
-            else:
-                st.write("No ratings data")
-
-        with col2:
-            if all_final_ratings:
-                final_rating_counts = (
-                    pd.Series(all_final_ratings).value_counts().sort_index()
-                )
-                
-                # Create a more detailed chart with axis labels
-                fig = px.bar(
-                    x=final_rating_counts.index, 
-                    y=final_rating_counts.values,
-                    labels={"x": "Review Score", "y": "Review Count"},
-                    title="Final Ratings Distribution"
-                )
-                fig.update_layout(showlegend=False, height=300)
-                st.plotly_chart(fig, width='stretch')
-            else:
-                st.write("No final ratings data")
-
-        # Statistics
-        st.subheader("📈 Overall Statistics")
-
-        if all_ratings:
-            col1, col2, col3, col4 = st.columns(4)
-
-            with col1:
-                st.metric(
-                    "Avg Preliminary Rating", f"{pd.Series(all_ratings).mean():.2f}"
-                )
-
-            with col2:
-                st.metric("Std Dev Preliminary", f"{pd.Series(all_ratings).std():.2f}")
-
-            with col3:
-                st.metric(
-                    "Avg Final Rating", f"{pd.Series(all_final_ratings).mean():.2f}"
-                )
-
-            with col4:
-                st.metric("Std Dev Final", f"{pd.Series(all_final_ratings).std():.2f}")
-
-        # Meta-Review Decision Statistics
-        st.subheader("📋 Meta-Review Decision Analysis")
-        
-        # Count meta-review decisions
-        prelim_accept = 0
-        prelim_reject = 0
-        prelim_discussion = 0
-        final_accept = 0
-        final_reject = 0
-        final_discussion = 0
-        
-        for sub in st.session_state.submissions:
-            if sub.meta_review:
-                # Preliminary decisions
-                if sub.meta_review.preliminary_decision:
-                    prelim_lower = sub.meta_review.preliminary_decision.lower()
-                    if "accept" in prelim_lower:
-                        prelim_accept += 1
-                    elif "reject" in prelim_lower:
-                        prelim_reject += 1
-                    elif "discussion" in prelim_lower:
-                        prelim_discussion += 1
-                
-                # Final decisions
-                if sub.meta_review.final_decision:
-                    final_lower = sub.meta_review.final_decision.lower()
-                    if "accept" in final_lower:
-                        final_accept += 1
-                    elif "reject" in final_lower:
-                        final_reject += 1
-                    elif "discussion" in final_lower:
-                        final_discussion += 1
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            meta_prelim_data = {
-                "Accept": prelim_accept,
-                "Reject": prelim_reject,
-                "Discussion": prelim_discussion
-            }
-            
-            # Create Plotly chart with axis labels
-            fig = px.bar(
-                x=list(meta_prelim_data.keys()),
-                y=list(meta_prelim_data.values()),
-                labels={"x": "Decision Type", "y": "Count"},
-                title="Preliminary Meta-Review Decisions"
-            )
-            fig.update_layout(showlegend=False, height=300)
-            st.plotly_chart(fig, width='stretch')
-            
-            # Calculate percentages
-            total_prelim = prelim_accept + prelim_reject + prelim_discussion
-            st.subheader(f"Active papers:")
-            if total_prelim > 0:
-                st.write(f"✅ Accept: {prelim_accept} ({prelim_accept/total_prelim*100:.1f}%)")
-                st.write(f"❌ Reject: {prelim_reject} ({prelim_reject/total_prelim*100:.1f}%)")
-                st.write(f"🔄 Discussion: {prelim_discussion} ({prelim_discussion/total_prelim*100:.1f}%)")
-            else:
-                st.write("No preliminary meta-review decisions found")
-        
-        with col2:
-            meta_final_data = {
-                "Accept": final_accept,
-                "Reject": final_reject,
-                "Discussion": final_discussion
-            }
-            
-            # Create Plotly chart with axis labels
-            fig = px.bar(
-                x=list(meta_final_data.keys()),
-                y=list(meta_final_data.values()),
-                labels={"x": "Decision Type", "y": "Count"},
-                title="Final Meta-Review Decisions"
-            )
-            fig.update_layout(showlegend=False, height=300)
-            st.plotly_chart(fig, width='stretch')
-            
-            # Calculate percentages
-            total_final = final_accept + final_reject + final_discussion
-            if total_final > 0:
-                st.write(f"✅ Accept: {final_accept} ({final_accept/total_final*100:.1f}%)")
-                st.write(f"❌ Reject: {final_reject} ({final_reject/total_final*100:.1f}%)")
-                st.write(f"🔄 Discussion: {final_discussion} ({final_discussion/total_final*100:.1f}%)")
-            else:
-                st.write("No final meta-review decisions found")
-
-        # Status Statistics
-        st.subheader("Status Analysis")
-        
-        withdrawn_count = sum(1 for sub in st.session_state.submissions if sub.withdrawn)
-        desk_rejected_count = sum(1 for sub in st.session_state.submissions if sub.desk_rejected)
-        active_count = total_submissions - withdrawn_count -  desk_rejected_count
-        withdrawal_percentage = (withdrawn_count / total_submissions) * 100
-        desk_rejected_percentage = (desk_rejected_count / total_submissions) * 100
-
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("Total Papers", total_submissions)
-        with col2:
-            st.metric("🚫 Withdrawn", f'{withdrawal_percentage:.2f}% ({withdrawn_count})')
-        with col3:
-            st.metric("📋 Desk Rejected", f'{desk_rejected_percentage:.2f}% ({desk_rejected_count})')
-        with col4:
-            st.metric("✅ Active", f'{(active_count/total_submissions)*100:.2f}% ({active_count})')
-        
-        # Rating Improvement Analysis
-        st.subheader("📈 Rating Improvement Analysis")
-        
-        # Add threshold slider
-        threshold = st.slider("Rating Threshold", min_value=1.0, max_value=6.0, value=4.0, step=0.1)
-        
-        improved_papers = []
-        declined_papers = []
-        
-        for sub in st.session_state.submissions:
-            if sub.avg_rating > 0 and sub.avg_final_rating > 0:
-                if sub.avg_rating <= threshold and sub.avg_final_rating > threshold:
-                    improved_papers.append(sub)
-                elif sub.avg_rating > threshold and sub.avg_final_rating <= threshold:
-                    declined_papers.append(sub)
-        
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(f"📈 Below {threshold} → Above {threshold}", len(improved_papers))
-        with col2:
-            st.metric(f"📉 Above {threshold} → Below {threshold}", len(declined_papers))
-        with col3:
-            papers_with_ratings = len([s for s in st.session_state.submissions if s.avg_rating > 0 and s.avg_final_rating > 0])
-            improvement_rate = (len(improved_papers) / papers_with_ratings) * 100 if papers_with_ratings > 0 else 0
-            st.metric("📊 Improvement Rate", f"{improvement_rate:.1f}%")
-        with col4:
-            decline_rate = (len(declined_papers) / papers_with_ratings) * 100 if papers_with_ratings > 0 else 0
-            st.metric("📉 Decline Rate", f"{decline_rate:.1f}%")
-        
-        # Show detailed lists if there are papers
-        if improved_papers:
-            with st.expander(f"📈 Papers that improved from ≤{threshold} to >{threshold}", expanded=False):
-                for sub in improved_papers:
-                    st.write(f"• {sub.sub_id}: {sub.avg_rating:.2f} → {sub.avg_final_rating:.2f} (+{sub.avg_final_rating - sub.avg_rating:.2f})")
-        
-        if declined_papers:
-            with st.expander(f"📉 Papers that declined from >{threshold} to ≤{threshold}", expanded=False):
-                for sub in declined_papers:
-                    st.write(f"• {sub.sub_id}: {sub.avg_rating:.2f} → {sub.avg_final_rating:.2f} ({sub.avg_final_rating - sub.avg_rating:.2f})")
-
-        # Top and bottom submissions
-        st.subheader("🏆 Top & Bottom Performers")
-
-        # Sort by average rating
-        sorted_submissions = sorted(
-            [sub for sub in st.session_state.submissions if sub.avg_rating > 0],
-            key=lambda x: x.avg_rating,
-            reverse=True,
-        )
-
-        if sorted_submissions:
-            col1, col2 = st.columns(2)
-
-            with col1:
-                st.write("**🥇 Top 5 Submissions**")
-                top_5 = sorted_submissions[:5]
-                for i, sub in enumerate(top_5, 1):
-                    st.write(
-                        f"{i}. {sub.sub_id} - {sub.title[:50]}... ({sub.avg_rating:.2f})"
-                    )
-
-            with col2:
-                st.write("**📉 Bottom 5 Submissions**")
-                bottom_5 = (
-                    sorted_submissions[-5:]
-                    if len(sorted_submissions) >= 5
-                    else sorted_submissions
-                )
-                for i, sub in enumerate(bottom_5, 1):
-                    st.write(
-                        f"{i}. {sub.sub_id} - {sub.title[:50]}... ({sub.avg_rating:.2f})"
-                    )
+        _render_analytics()
 
 
 if __name__ == "__main__":
@@ -25,8 +25,12 @@ from ac_conference_helper.core.display import (
     parse_display_args,
     print_incomplete_ratings_table,
     display_results,
+    save_anonymized_reviews,
+    _submissions_to_plain_dataframe,
+    load_submissions_arrow,
+    save_submissions_arrow,
 )
-from ac_conference_helper.core.models import Submission, Review
+from ac_conference_helper.core.models import MetaReview, Review, Submission, SubmissionStatus
 
 
 
@@ -310,6 +314,17 @@ class TestSaveToCSV:
         mock_to_csv.assert_called_once_with("test.csv", index=False)
         assert "Results saved to test.csv" in output
 
+    @patch('ac_conference_helper.core.display.PYARROW_AVAILABLE', True)
+    @patch('pandas.DataFrame.to_csv')
+    def test_save_to_csv_ignores_pyarrow(self, mock_to_csv):
+        """Test CSV output goes through pandas even when pyarrow is installed."""
+        sub = Submission(title="Test Paper", sub_id="123", url="http://example.com")
+
+        with redirect_stdout(io.StringIO()):
+            save_to_csv([sub], "test.csv")
+
+        mock_to_csv.assert_called_once_with("test.csv", index=False)
+
 
 class TestParseDisplayArgs:
     """Test parse_display_args function."""
@@ -428,6 +443,111 @@ class TestPrintIncompleteRatingsTable:
         assert "Incomplete Paper" in output
 
 
+class TestDisplayResults:
+    """Test display_results function."""
+
+    def test_builds_dataframe_once(self):
+        """Test the table and CSV outputs share a single DataFrame build."""
+        sub = Submission(title="Test Paper", sub_id="123", url="http://example.com")
+        args = argparse.Namespace(csv_only=False, format="grid", output=None, save_reviews=None)
+
+        f = io.StringIO()
+        with patch(
+            "ac_conference_helper.core.display._submissions_to_plain_dataframe",
+            wraps=_submissions_to_plain_dataframe,
+        ) as mock_build, patch(
+            "ac_conference_helper.core.display.print_incomplete_ratings_table"
+        ), redirect_stdout(f):
+            display_results([sub], args)
+
+        mock_build.assert_called_once_with([sub], include_urls=True)
+        assert "CSV OUTPUT" in f.getvalue()
+        output = f.getvalue()
+        assert f"{Colors.BLUE}http://example.com{Colors.END}" in output
+        assert "http://example.com, -, -" in output
+
+    @patch('ac_conference_helper.core.display.PYARROW_AVAILABLE', False)
+    def test_feather_output_without_pyarrow(self, tmp_path):
+        """Test .feather output reports the missing pyarrow instead of failing."""
+        sub = Submission(title="Test Paper", sub_id="123", url="http://example.com")
+        output_file = tmp_path / "results.feather"
+        args = argparse.Namespace(csv_only=True, format="grid", output=str(output_file), save_reviews=None)
+
+        f = io.StringIO()
+        with patch("ac_conference_helper.core.display.print_incomplete_ratings_table"), redirect_stdout(f):
+            display_results([sub], args)
+
+        assert "Feather output requires pyarrow" in f.getvalue()
+        assert not output_file.exists()
+
+    def test_plain_dataframe_has_no_colors(self):
+        """Test the shared DataFrame keeps raw values and a row color column."""
+        sub = Submission(title="Test Paper", sub_id="123", url="http://example.com")
+
+        df = _submissions_to_plain_dataframe([sub], include_urls=True)
+
+        row = df.iloc[0]
+        assert row["ID"] == "123"
+        assert row["URL"] == "http://example.com"
+        assert row["_row_color"] == Colors.RED
+
+
+class TestSaveAnonymizedReviews:
+    """Test save_anonymized_reviews function."""
+
+    def test_writes_one_file_per_submission(self, tmp_path):
+        """Test review files contain the anonymized reviewer ID and fields."""
+        review = Review(
+            reviewer_id="abc1 (Jane Doe)",
+            paper_summary="A summary",
+            preliminary_recommendation="5: Accept",
+            confidence_level="4: High",
+        )
+        sub = Submission(title="Test Paper", sub_id="123", url="http://example.com", reviews=[review])
+
+        with redirect_stdout(io.StringIO()):
+            save_anonymized_reviews([sub], str(tmp_path))
+
+        content = (tmp_path / "123_Test Paper.txt").read_text(encoding="utf-8")
+        assert content.startswith("Submission ID: 123\nTitle: Test Paper\n")
+        assert "REVIEWER abc1\n" in content
+        assert "Jane Doe" not in content
+        assert "Paper Summary:\nA summary\n\n" in content
+
+
+class TestSubmissionsArrow:
+    """Test the Arrow IPC submissions cache."""
+
+    def test_round_trip(self, tmp_path):
+        """Test submissions, reviews and meta-reviews survive a save/load cycle."""
+        pytest.importorskip("pyarrow")
+        review = Review(
+            reviewer_id="abc1",
+            preliminary_recommendation="4: Borderline Accept",
+            confidence_level="3: Medium",
+            final_recommendation="5: Weak Accept",
+        )
+        subs = [
+            Submission(
+                title="Test Paper",
+                sub_id="123",
+                url="http://example.com",
+                reviews=[review],
+                meta_review=MetaReview(content="Final Recommendation: Accept"),
+            ),
+            Submission(title="Withdrawn", sub_id="124", url="http://example.com",
+                       status=SubmissionStatus.WITHDRAWN),
+        ]
+        filename = str(tmp_path / "submissions.arrow")
+
+        save_submissions_arrow(subs, filename)
+        loaded = load_submissions_arrow(filename)
+
+        assert [sub.model_dump_json() for sub in loaded] == [sub.model_dump_json() for sub in subs]
+        assert loaded[0].ratings == [4]
+        assert loaded[0].meta_review.final_decision == "Accept"
+        assert loaded[1].status == SubmissionStatus.WITHDRAWN
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
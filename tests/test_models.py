@@ -2,16 +2,26 @@
 
 import pytest
 import io
+import pickle
 import sys
 import os
 from contextlib import redirect_stdout
+import numpy as np
+from pydantic import ValidationError
 
 # Add parent directory to path to import modules
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from ac_conference_helper.core.models import Review, Submission, int_list_to_str
+from ac_conference_helper.core.models import (
+    DecisionCategory,
+    MetaReview,
+    Review,
+    Submission,
+    classify_decision,
+    int_list_to_str,
+)
 
 class TestReview:
     """Test the Review class."""
@@ -51,6 +61,8 @@ class TestReview:
             ("6: Accept", 6),
             ("Reject", 1),
             ("Accept", 6),
+            ("Weak Reject", 2),
+            ("Borderline Accept", 4),
         ]
         
         for text, expected in test_cases:
@@ -80,14 +92,38 @@ class TestReview:
         review = Review(confidence_level="4: High")
         assert review.numeric_confidence == 4
 
+        review = Review(confidence_level="Confidence level 3 (medium)")
+        assert review.numeric_confidence == 3
+
     def test_numeric_confidence_invalid(self):
         """Test extracting numeric confidence from invalid input."""
         review = Review()
         assert review.numeric_confidence is None
         
-        review.confidence_level = "Invalid"
+        review = Review(confidence_level="Invalid")
         assert review.numeric_confidence is None
 
+    def test_review_is_frozen(self):
+        """Test review fields cannot be reassigned after creation."""
+        review = Review(confidence_level="3: Medium")
+
+        with pytest.raises(ValidationError):
+            review.confidence_level = "4: High"
+
+    def test_cached_ratings_reset_on_copy(self):
+        """Test cached numeric values are recomputed on an updated copy."""
+        review = Review(preliminary_recommendation="2: Weak Reject", confidence_level="3: Medium")
+        assert review.numeric_rating_preliminary_recommendation == 2
+        assert review.numeric_confidence == 3
+
+        updated = review.model_copy(
+            update={"preliminary_recommendation": "5: Weak Accept", "confidence_level": "4: High"}
+        )
+
+        assert updated.numeric_rating_preliminary_recommendation == 5
+        assert updated.numeric_confidence == 4
+        assert review.numeric_rating_preliminary_recommendation == 2
+
     def test_model_dump(self):
         """Test model_dump method includes computed properties."""
         review = Review(
@@ -147,6 +183,53 @@ class TestReview:
         assert "No review data available" in output
 
 
+class TestMetaReview:
+    """Test the MetaReview class."""
+
+    def test_extract_decisions(self):
+        """Test preliminary and final decisions are normalized."""
+        meta = MetaReview(
+            content="Preliminary Recommendation: accept\nFinal Recommendation: CLEAR REJECT"
+        )
+
+        assert meta.preliminary_decision == "Accept"
+        assert meta.final_decision == "Clear Reject"
+
+    def test_extract_decision_priority(self):
+        """Test higher-priority phrases win regardless of position."""
+        meta = MetaReview(content="Preliminary Recommendation: accept, needs discussion")
+
+        assert meta.preliminary_decision == "Needs Discussion"
+        assert meta.final_decision is None
+
+    def test_extract_decision_unknown(self):
+        """Test unrecognized decisions are returned verbatim."""
+        meta = MetaReview(content="Final Recommendation: Withdrawn ")
+
+        assert meta.final_decision == "Withdrawn"
+
+    def test_decision_categories(self):
+        """Test decisions are classified into coarse categories."""
+        meta = MetaReview(
+            content="Preliminary Recommendation: borderline\nFinal Recommendation: Clear Accept"
+        )
+
+        assert meta.preliminary_category is DecisionCategory.DISCUSSION
+        assert meta.final_category is DecisionCategory.ACCEPT
+        assert MetaReview().final_category is DecisionCategory.MISSING
+        assert classify_decision("Withdrawn") is DecisionCategory.OTHER
+
+    def test_str_representation(self):
+        """Test string representation of meta-review."""
+        meta = MetaReview(content="Final Recommendation: Accept")
+
+        assert str(meta) == (
+            "Meta Review:\n"
+            "Final Decision: Accept\n"
+            "Content: Final Recommendation: Accept\n"
+        )
+
+
 class TestSubmission:
     """Test the Submission class."""
 
@@ -188,6 +271,22 @@ class TestSubmission:
         
         assert sub.ratings == [5, 6, 4]
 
+    def test_rating_arrays(self):
+        """Test rating arrays mirror the rating lists as int8 arrays."""
+        review1 = Review(preliminary_recommendation="5: Weak Accept", final_recommendation="6: Accept", confidence_level="4: High")
+        review2 = Review(preliminary_recommendation="2: Weak Reject", confidence_level="3: Medium")
+
+        sub = Submission(
+            title="Test",
+            sub_id="123",
+            url="http://example.com",
+            reviews=[review1, review2]
+        )
+
+        assert sub.rating_array.dtype == np.int8
+        assert sub.rating_array.tolist() == sub.ratings == [5, 2]
+        assert sub.final_rating_array.tolist() == sub.final_ratings == [6, -1]
+
     def test_confidences_property(self):
         """Test confidences property extraction."""
         review1 = Review(preliminary_recommendation="5: Weak Accept", confidence_level="4: High")
@@ -257,6 +356,58 @@ class TestSubmission:
         assert sub.ratings == [5, 6]
         assert sub.confidences == [4, 3]
 
+    def test_title_short(self):
+        """Test long titles are truncated for compact listings."""
+        short = Submission(title="Short title", sub_id="1", url="http://example.com")
+        long = Submission(title="x" * 60, sub_id="2", url="http://example.com")
+
+        assert short.title_short == "Short title"
+        assert long.title_short == "x" * 50 + "..."
+
+    def test_equality_ignores_cached_values(self):
+        """Test equal submissions compare equal once their rating arrays are cached."""
+        def make(title="Test"):
+            reviews = [
+                Review(preliminary_recommendation="4: Borderline Accept", confidence_level="3: Medium"),
+                Review(preliminary_recommendation="6: Accept", confidence_level="4: High"),
+            ]
+            return Submission(title=title, sub_id="123", url="http://example.com", reviews=reviews)
+
+        sub = make()
+        assert sub.avg_rating == 5.0
+        assert sub == make()
+        assert sub != make("Other")
+
+    def test_pickle_drops_cached_values(self):
+        """Test pickled submissions carry only their fields and recompute cached values."""
+        review = Review(preliminary_recommendation="4: Borderline Accept", confidence_level="3: Medium")
+        sub = Submission(title="Test", sub_id="123", url="http://example.com", reviews=[review])
+
+        restored = pickle.loads(pickle.dumps(sub))
+
+        assert "_rating_arrays" not in restored.__dict__
+        assert restored == sub
+        assert restored.ratings == [4]
+
+    def test_chat_context(self):
+        """Test the chat context snapshot and its reset on field reassignment."""
+        review = Review(
+            paper_summary="Nice paper",
+            preliminary_recommendation="4: Borderline Accept",
+            confidence_level="3: Medium",
+        )
+        sub = Submission(title="Test", sub_id="123", url="http://example.com", reviews=[review])
+
+        context = sub.chat_context
+        assert context["submission_id"] == "123"
+        assert context["avg_rating"] == 4.0
+        assert context["reviews"][0]["reviewer_id"] == "reviewer_0"
+        assert context["reviews"][0]["content"].startswith("Review 1: Nice paper\n")
+        assert sub.chat_context is context
+
+        sub.title = "Renamed"
+        assert sub.chat_context["title"] == "Renamed"
+
     def test_avg_rating(self):
         """Test average rating calculation."""
         review1 = Review(preliminary_recommendation="4: Borderline Accept", confidence_level="3: Medium")
@@ -324,6 +475,22 @@ class TestSubmission:
         
         assert sub.detailed_reviews_count == 2
 
+    def test_num_valid_ratings(self):
+        """Test valid rating counts skip missing (-1) ratings."""
+        review1 = Review(preliminary_recommendation="5: Weak Accept", final_recommendation="6: Accept", confidence_level="4: High")
+        review2 = Review(preliminary_recommendation="3: Borderline Reject", confidence_level="3: Medium")
+
+        sub = Submission(
+            title="Test",
+            sub_id="123",
+            url="http://example.com",
+            reviews=[review1, review2]
+        )
+
+        assert sub.final_ratings == [6, -1]
+        assert sub.num_valid_ratings == 2
+        assert sub.num_valid_final_ratings == 1
+
     def test_review_without_final_recommendation(self):
         """Test review without final recommendation."""
         review = Review(
@@ -374,6 +541,30 @@ class TestSubmission:
         assert dump["has_rebuttal"] is True
         assert dump["pdf_url"] == "http://example.com/pdf"
 
+    def test_model_dump_reset_on_assignment(self):
+        """Test model_dump reflects reassigned fields after being cached."""
+        sub = Submission(title="Test", sub_id="123", url="http://example.com")
+        assert sub.model_dump()["title"] == "Test"
+
+        sub.title = "Updated"
+
+        assert sub.model_dump()["title"] == "Updated"
+
+    def test_model_dump_isolated_from_cache(self):
+        """Test modifying a returned dump does not affect later dumps."""
+        review = Review(preliminary_recommendation="6: Accept", confidence_level="4: High")
+        sub = Submission(title="Test", sub_id="123", url="http://example.com", reviews=[review])
+
+        dump = sub.model_dump()
+        dump["ratings"].append(99)
+        dump["reviews"][0]["reviewer_id"] = "changed"
+        dump["reviews"].clear()
+
+        fresh = sub.model_dump()
+        assert fresh["ratings"] == [6]
+        assert len(fresh["reviews"]) == 1
+        assert fresh["reviews"][0]["reviewer_id"] is None
+
     def test_str_representation(self):
         """Test string representation calls pretty_print."""
         sub = Submission(title="Test", sub_id="123", url="http://example.com")
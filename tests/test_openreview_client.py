@@ -13,7 +13,11 @@ parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
-from ac_conference_helper.client.openreview_client import OpenReviewClient
+from ac_conference_helper.client.openreview_client import (
+    OpenReviewClient,
+    _scan_review_fields,
+    _scan_subheading,
+)
 from ac_conference_helper.core.models import Review, Submission
 
 
@@ -636,5 +640,44 @@ class TestOpenReviewClient:
         mock_load.assert_not_called()
 
 
+class TestReviewScanners:
+    """Test the single-pass review field and subheading lexers."""
+
+    def test_scan_review_fields(self):
+        """Test fields stop at the next capitalised line and headers span to the colon."""
+        content = (
+            "Paper Summary:\n  A summary\nover two lines\n"
+            "Justification For Recommendation And Suggestions For Rebuttal:\nSolid work\n"
+            "Confidence Level: 4\nPaper Strengths:\n\n"
+        )
+
+        fields = _scan_review_fields(content)
+
+        assert fields == {
+            "paper_summary": "A summary\nover two lines",
+            "justification_for_recommendation": "Solid work",
+            "confidence_level": "4",
+        }
+
+    def test_scan_review_fields_first_occurrence_wins(self):
+        """Test only the first header occurrence is used."""
+        fields = _scan_review_fields("Paper Summary: first\nPaper Summary: second")
+
+        assert fields == {"paper_summary": "first"}
+
+    def test_scan_subheading(self):
+        """Test reviewer ID, submission date and modified date extraction."""
+        info = _scan_subheading(
+            "Official Review by Reviewer abc1 (Anonymous) 15 Dec 2023, 10:30 "
+            "(modified: 20 Dec 2023, 15:45)"
+        )
+
+        assert info == {
+            "reviewer_id": "abc1 (Anonymous)",
+            "submission_date": "15 Dec 2023, 10:30",
+            "modified_date": "20 Dec 2023, 15:45",
+        }
+
+
 if __name__ == "__main__":
     pytest.main([__file__])